@@ -13,6 +13,12 @@ from pathlib import Path
 from typing import List, Dict, Any
 import argparse
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
@@ -34,26 +40,33 @@ def setup_logging():
 
 
 def find_processed_files(data_dir: str = "data_output/processed") -> List[str]:
-    """Find processed JSON files in the data directory."""
+    """Find processed JSON and Parquet files in the data directory."""
     data_path = Path(data_dir)
     if not data_path.exists():
         raise FileNotFoundError(f"Data directory not found: {data_dir}")
 
-    json_files = list(data_path.glob("*.json"))
-    if not json_files:
-        raise FileNotFoundError(f"No JSON files found in {data_dir}")
+    data_files = list(data_path.glob("*.json")) + list(data_path.glob("*.parquet"))
+    if not data_files:
+        raise FileNotFoundError(f"No JSON or Parquet files found in {data_dir}")
 
-    return [str(f) for f in json_files]
+    return [str(f) for f in data_files]
 
 
 def load_data(file_paths: List[str]) -> pd.DataFrame:
-    """Load and combine data from multiple JSON files."""
+    """Load and combine data from multiple JSON and Parquet files."""
     all_data = []
+    frames = []
 
     for file_path in file_paths:
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if file_path.endswith('.parquet'):
+                frame = pd.read_parquet(file_path)
+                frames.append(frame)
+                logging.info(f"Loaded {len(frame)} records from {file_path}")
+                continue
+
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read()) if HAS_ORJSON else json.load(f)
 
             if isinstance(data, list):
                 all_data.extend(data)
@@ -66,10 +79,13 @@ def load_data(file_paths: List[str]) -> pd.DataFrame:
             logging.error(f"Error loading {file_path}: {e}")
             continue
 
-    if not all_data:
+    if all_data:
+        frames.insert(0, pd.DataFrame(all_data))
+
+    if not frames:
         raise ValueError("No data loaded from input files")
 
-    df = pd.DataFrame(all_data)
+    df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
     logging.info(f"Total records loaded: {len(df)}")
     return df
 
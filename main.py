@@ -92,7 +92,8 @@ class InteractiveExportMenu:
         '4': (['json', 'csv'], 'JSON and CSV'),
         '5': (['json', 'excel'], 'JSON and Excel'),
         '6': (['csv', 'excel'], 'CSV and Excel'),
-        '7': (['json', 'csv', 'excel'], 'All formats (JSON, CSV, Excel)')
+        '7': (['json', 'csv', 'excel'], 'All formats (JSON, CSV, Excel)'),
+        '8': (['parquet'], 'Parquet only')
     }
 
     @classmethod
@@ -110,14 +111,14 @@ class InteractiveExportMenu:
         """Get user's export format choice"""
         while True:
             cls.display_menu()
-            choice = input("\nSelect export format (1-7): ").strip()
+            choice = input("\nSelect export format (1-8): ").strip()
 
             if choice in cls.EXPORT_OPTIONS:
                 formats, description = cls.EXPORT_OPTIONS[choice]
                 print(f"\nSelected: {description}")
                 return formats
             else:
-                print("\nInvalid choice. Please select a number between 1-7.")
+                print("\nInvalid choice. Please select a number between 1-8.")
 
 
 def configure_logging():
@@ -241,7 +242,7 @@ def run_alta_scraper(args, logger, error_tracker):
         filepath = scraper.run(args.category)
 
         if filepath and os.path.exists(filepath):
-            logger.info(f" Alta scraping completed. Data saved to: {filepath}")
+            logger.info(f" Alta scraping completed. {len(scraper.scraped_data)} products saved to: {filepath}")
             return True
         else:
             error_tracker.log_warning("AltaScraper", "Scraping completed but no data was saved or file not found",
@@ -448,7 +449,7 @@ def main():
     parser.add_argument('--skip-analysis', action='store_true',
                         help='Skip automated analysis after processing')
     parser.add_argument('--export-formats', type=str, nargs='+',
-                        choices=['json', 'csv', 'excel'],
+                        choices=['json', 'csv', 'excel', 'parquet'],
                         help='Export formats (bypasses interactive menu)')
     parser.add_argument('--generate-diagnostics', action='store_true',
                         help='Generate detailed diagnostics report')
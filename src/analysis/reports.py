@@ -7,6 +7,12 @@ from datetime import datetime
 import json
 from pathlib import Path
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Optional visualization imports
 try:
     import matplotlib.pyplot as plt
@@ -145,7 +151,7 @@ class ReportGenerator:
                 plt.xticks(rotation=45)
                 
                 plt.subplot(2, 2, 4)
-                category_avg_prices = self.data.groupby('category')['price'].mean().sort_values(ascending=False)
+                category_avg_prices = self.data.groupby('category', observed=True)['price'].mean().sort_values(ascending=False)
                 category_avg_prices.plot(kind='bar', color='lightgreen')
                 plt.title('Average Price by Category')
                 plt.xlabel('Category')
@@ -174,7 +180,7 @@ class ReportGenerator:
             # Brand price comparison
             if 'price' in self.data.columns:
                 plt.subplot(1, 2, 2)
-                brand_avg_prices = self.data.groupby('brand')['price'].mean().sort_values(ascending=False).head(10)
+                brand_avg_prices = self.data.groupby('brand', observed=True)['price'].mean().sort_values(ascending=False).head(10)
                 brand_avg_prices.plot(kind='bar', color='orange')
                 plt.title('Top 10 Brands by Average Price')
                 plt.xlabel('Brand')
@@ -460,8 +466,8 @@ def create_analysis_pipeline(input_files: List[str], output_dir: str = None) ->
     for file_path in input_files:
         try:
             if file_path.endswith('.json'):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(file_path, 'rb') as f:
+                    data = orjson.loads(f.read()) if HAS_ORJSON else json.load(f)
                 if isinstance(data, list):
                     all_data.extend(data)
                 else:
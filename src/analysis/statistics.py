@@ -7,9 +7,10 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 import logging
+import os
+import tempfile
+import time
 from datetime import datetime, timedelta
-import warnings
-warnings.filterwarnings('ignore')
 
 # Optional imports
 try:
@@ -26,21 +27,50 @@ try:
 except ImportError:
     HAS_VISUALIZATION = False
 
+try:
+    import duckdb
+    HAS_DUCKDB = True
+except ImportError:
+    HAS_DUCKDB = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 class StatisticalAnalyzer:
     """Comprehensive statistical analysis for e-commerce data."""
     
+    SHAPIRO_MAX_SAMPLES = 5000
+    MAX_OUTLIER_VALUES = 100
+    OUTLIER_HISTOGRAM_BINS = 20
+    
     def __init__(self, data: pd.DataFrame):
-        self.data = data.copy()
+        # Keep a reference to the caller's frame; only the parsed columns are materialized.
+        self.data = data
         self.logger = logging.getLogger(__name__)
+        self._createdat: Optional[pd.Series] = None
+        self._price: Optional[pd.Series] = None
         self._prepare_data()
     
     def _prepare_data(self):
         """Prepare data for analysis."""
         if 'createdat' in self.data.columns:
-            self.data['createdat'] = pd.to_datetime(self.data['createdat'], errors='coerce')
+            self._createdat = pd.to_datetime(self.data['createdat'], errors='coerce')
         
         if 'price' in self.data.columns:
-            self.data['price'] = pd.to_numeric(self.data['price'], errors='coerce')
+            self._price = pd.to_numeric(self.data['price'], errors='coerce')
+    
+    @classmethod
+    def from_parquet(cls, path: str) -> 'StatisticalAnalyzer':
+        """Create an analyzer from a Parquet file or glob of partitioned files."""
+        if HAS_DUCKDB:
+            data = duckdb.read_parquet(path).df()
+        else:
+            data = pd.read_parquet(path)
+        return cls(data)
     
     def descriptive_statistics(self) -> Dict[str, Any]:
         """Generate comprehensive descriptive statistics."""
@@ -55,36 +85,20 @@ class StatisticalAnalyzer:
         }
         
         # Price statistics
-        if 'price' in self.data.columns:
-            price_data = self.data['price'].dropna()
-            stats_report['price_statistics'] = {
-                'count': len(price_data),
-                'mean': float(price_data.mean()),
-                'median': float(price_data.median()),
-                'std': float(price_data.std()),
-                'min': float(price_data.min()),
-                'max': float(price_data.max()),
-                'q25': float(price_data.quantile(0.25)),
-                'q75': float(price_data.quantile(0.75)),
-                'iqr': float(price_data.quantile(0.75) - price_data.quantile(0.25)),
-                'skewness': float(stats.skew(price_data)) if HAS_SCIPY else None,
-                'kurtosis': float(stats.kurtosis(price_data)) if HAS_SCIPY else None
-            }
+        if self._price is not None:
+            price_data = self._price.dropna()
+            if HAS_DUCKDB:
+                price_statistics, price_by_category = self._price_summary_sql()
+            else:
+                price_statistics, price_by_category = self._price_summary_pandas(price_data)
+            
+            price_statistics['skewness'] = float(stats.skew(price_data)) if HAS_SCIPY else None
+            price_statistics['kurtosis'] = float(stats.kurtosis(price_data)) if HAS_SCIPY else None
+            stats_report['price_statistics'] = price_statistics
             
             # Price by category
-            if 'category' in self.data.columns:
-                stats_report['price_by_category'] = {}
-                for category in self.data['category'].unique():
-                    cat_prices = self.data[self.data['category'] == category]['price'].dropna()
-                    if len(cat_prices) > 0:
-                        stats_report['price_by_category'][category] = {
-                            'count': len(cat_prices),
-                            'mean': float(cat_prices.mean()),
-                            'median': float(cat_prices.median()),
-                            'std': float(cat_prices.std()),
-                            'min': float(cat_prices.min()),
-                            'max': float(cat_prices.max())
-                        }
+            if price_by_category is not None:
+                stats_report['price_by_category'] = price_by_category
         
         # Text field statistics
         text_fields = ['name', 'description', 'brand']
@@ -92,23 +106,131 @@ class StatisticalAnalyzer:
         
         for field in text_fields:
             if field in self.data.columns:
-                text_data = self.data[field].astype(str)
-                stats_report['text_statistics'][field] = {
-                    'avg_length': float(text_data.str.len().mean()),
-                    'min_length': int(text_data.str.len().min()),
-                    'max_length': int(text_data.str.len().max()),
-                    'unique_count': int(text_data.nunique()),
-                    'empty_count': int((text_data == '').sum())
-                }
+                stats_report['text_statistics'][field] = self._text_statistics(self.data[field])
         
         return stats_report
     
+    def _price_summary_pandas(self, price_data: pd.Series) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Compute overall and per-category price statistics with pandas."""
+        price_statistics = {
+            'count': len(price_data),
+            'mean': float(price_data.mean()),
+            'median': float(price_data.median()),
+            'std': float(price_data.std()),
+            'min': float(price_data.min()),
+            'max': float(price_data.max()),
+            'q25': float(price_data.quantile(0.25)),
+            'q75': float(price_data.quantile(0.75)),
+            'iqr': float(price_data.quantile(0.75) - price_data.quantile(0.25))
+        }
+        
+        if 'category' not in self.data.columns:
+            return price_statistics, None
+        
+        price_by_category = {}
+        for category in self.data['category'].unique():
+            cat_prices = self._price[self.data['category'] == category].dropna()
+            if len(cat_prices) > 0:
+                price_by_category[category] = {
+                    'count': len(cat_prices),
+                    'mean': float(cat_prices.mean()),
+                    'median': float(cat_prices.median()),
+                    'std': float(cat_prices.std()),
+                    'min': float(cat_prices.min()),
+                    'max': float(cat_prices.max())
+                }
+        
+        return price_statistics, price_by_category
+    
+    def _price_summary_sql(self) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Compute overall and per-category price statistics in DuckDB aggregate queries."""
+        def as_float(value) -> float:
+            return float('nan') if value is None else float(value)
+        
+        prices = pd.DataFrame({'row_id': np.arange(len(self._price)), 'price': self._price.to_numpy()})
+        has_category = 'category' in self.data.columns
+        if has_category:
+            prices['category'] = self.data['category'].to_numpy()
+        
+        con = duckdb.connect()
+        try:
+            con.register('prices', prices)
+            count, mean, median, std, min_price, max_price, quartiles = con.execute("""
+                SELECT count(price), avg(price), median(price), stddev_samp(price),
+                       min(price), max(price), quantile_cont(price, [0.25, 0.75])
+                FROM prices WHERE price IS NOT NULL
+            """).fetchone()
+            q25, q75 = quartiles or (None, None)
+            
+            price_statistics = {
+                'count': int(count),
+                'mean': as_float(mean),
+                'median': as_float(median),
+                'std': as_float(std),
+                'min': as_float(min_price),
+                'max': as_float(max_price),
+                'q25': as_float(q25),
+                'q75': as_float(q75),
+                'iqr': as_float(q75) - as_float(q25)
+            }
+            
+            if not has_category:
+                return price_statistics, None
+            
+            # Groups come back in first-appearance order, matching the pandas path
+            rows = con.execute("""
+                SELECT category, count(price), avg(price), median(price), stddev_samp(price),
+                       min(price), max(price)
+                FROM prices
+                WHERE category IS NOT NULL
+                GROUP BY category
+                HAVING count(price) > 0
+                ORDER BY min(row_id)
+            """).fetchall()
+        finally:
+            con.close()
+        
+        price_by_category = {
+            category: {
+                'count': int(cat_count),
+                'mean': as_float(cat_mean),
+                'median': as_float(cat_median),
+                'std': as_float(cat_std),
+                'min': as_float(cat_min),
+                'max': as_float(cat_max)
+            }
+            for category, cat_count, cat_mean, cat_median, cat_std, cat_min, cat_max in rows
+        }
+        
+        return price_statistics, price_by_category
+    
+    def _text_statistics(self, values: pd.Series) -> Dict[str, Any]:
+        """Compute length statistics for a text column from a single lengths array."""
+        if HAS_PYARROW:
+            # Arrow strings store offsets, so lengths come from one kernel pass in C
+            text = values.astype('string[pyarrow]')
+            lengths = pc.utf8_length(pa.array(text)).fill_null(0).to_numpy()
+        else:
+            text = values.fillna('').astype(str)
+            lengths = np.fromiter(map(len, text), dtype=np.int64, count=len(text))
+        
+        if len(lengths) == 0:
+            return {'avg_length': 0.0, 'min_length': 0, 'max_length': 0, 'unique_count': 0, 'empty_count': 0}
+        
+        return {
+            'avg_length': float(lengths.mean()),
+            'min_length': int(lengths.min()),
+            'max_length': int(lengths.max()),
+            'unique_count': int(text.nunique()),
+            'empty_count': int((lengths == 0).sum())
+        }
+    
     def _get_date_range(self) -> Dict[str, str]:
         """Get date range of the data."""
-        if 'createdat' not in self.data.columns:
+        if self._createdat is None:
             return {}
         
-        dates = pd.to_datetime(self.data['createdat'], errors='coerce').dropna()
+        dates = self._createdat.dropna()
         if len(dates) == 0:
             return {}
         
@@ -120,10 +242,10 @@ class StatisticalAnalyzer:
     
     def price_distribution_analysis(self) -> Dict[str, Any]:
         """Analyze price distributions and identify patterns."""
-        if 'price' not in self.data.columns:
+        if self._price is None:
             return {'error': 'No price data available'}
         
-        price_data = self.data['price'].dropna()
+        price_data = self._price.dropna()
         
         analysis = {
             'distribution_tests': {},
@@ -131,27 +253,37 @@ class StatisticalAnalyzer:
             'price_segments': {}
         }
         
-        # Test for normal distribution
-        try:
-            shapiro_stat, shapiro_p = stats.shapiro(price_data.sample(min(5000, len(price_data))))
-            analysis['distribution_tests']['shapiro_wilk'] = {
-                'statistic': float(shapiro_stat),
-                'p_value': float(shapiro_p),
-                'is_normal': bool(shapiro_p > 0.05)
-            }
-        except:
-            pass
-        
-        # Kolmogorov-Smirnov test for normal distribution
-        try:
-            ks_stat, ks_p = stats.kstest(price_data, 'norm')
-            analysis['distribution_tests']['kolmogorov_smirnov'] = {
-                'statistic': float(ks_stat),
-                'p_value': float(ks_p),
-                'is_normal': bool(ks_p > 0.05)
-            }
-        except:
-            pass
+        # Test for normal distribution; Shapiro-Wilk p-values are unreliable above 5000 samples
+        if HAS_SCIPY:
+            price_values = price_data.to_numpy(dtype=np.float64)
+            if len(price_values) <= self.SHAPIRO_MAX_SAMPLES:
+                try:
+                    shapiro_stat, shapiro_p = stats.shapiro(price_values)
+                    analysis['distribution_tests']['shapiro_wilk'] = {
+                        'statistic': float(shapiro_stat),
+                        'p_value': float(shapiro_p),
+                        'is_normal': bool(shapiro_p > 0.05)
+                    }
+                except ValueError as e:
+                    self.logger.warning(f"Shapiro-Wilk test skipped: {e}")
+            else:
+                anderson_stat, anderson_p = self._anderson_test(price_values)
+                analysis['distribution_tests']['anderson_darling'] = {
+                    'statistic': anderson_stat,
+                    'p_value': anderson_p,
+                    'is_normal': bool(anderson_p > 0.05)
+                }
+            
+            # Kolmogorov-Smirnov test for normal distribution
+            try:
+                ks_stat, ks_p = stats.kstest(price_values, 'norm')
+                analysis['distribution_tests']['kolmogorov_smirnov'] = {
+                    'statistic': float(ks_stat),
+                    'p_value': float(ks_p),
+                    'is_normal': bool(ks_p > 0.05)
+                }
+            except ValueError as e:
+                self.logger.warning(f"Kolmogorov-Smirnov test skipped: {e}")
         
         # Outlier detection using IQR method
         Q1 = price_data.quantile(0.25)
@@ -161,12 +293,14 @@ class StatisticalAnalyzer:
         upper_bound = Q3 + 1.5 * IQR
         
         outliers = price_data[(price_data < lower_bound) | (price_data > upper_bound)]
+        outlier_values = outliers.to_numpy(dtype=np.float64)
         analysis['outliers'] = {
             'count': len(outliers),
             'percentage': len(outliers) / len(price_data) * 100,
             'lower_bound': float(lower_bound),
             'upper_bound': float(upper_bound),
-            'outlier_values': outliers.tolist()
+            'outlier_values': self._sample_values(outlier_values, self.MAX_OUTLIER_VALUES),
+            'outlier_histogram': self._histogram(outlier_values, self.OUTLIER_HISTOGRAM_BINS)
         }
         
         # Price segmentation
@@ -178,6 +312,38 @@ class StatisticalAnalyzer:
         
         return analysis
     
+    @staticmethod
+    def _sample_values(values: np.ndarray, limit: int) -> List[float]:
+        """Return at most limit values, sampled reproducibly and kept in their original order."""
+        if values.size <= limit:
+            return values.tolist()
+        
+        picked = np.random.default_rng(0).choice(values.size, limit, replace=False)
+        return values[np.sort(picked)].tolist()
+    
+    @staticmethod
+    def _histogram(values: np.ndarray, bins: int) -> Dict[str, List[float]]:
+        """Summarize values as histogram counts and bin edges."""
+        if values.size == 0:
+            return {'counts': [], 'bin_edges': []}
+        
+        counts, bin_edges = np.histogram(values, bins=bins)
+        return {'counts': counts.tolist(), 'bin_edges': bin_edges.tolist()}
+    
+    @staticmethod
+    def _anderson_test(values: np.ndarray) -> Tuple[float, float]:
+        """Run the Anderson-Darling normality test and return its statistic and p-value."""
+        try:
+            # SciPy >= 1.17 interpolates the p-value itself; critical_values goes away in 1.19
+            result = stats.anderson(values, dist='norm', method='interpolate')
+            return float(result.statistic), float(result.pvalue)
+        except TypeError:
+            result = stats.anderson(values, dist='norm')
+        
+        # Older SciPy: interpolate the tabulated critical values, clamped outside the table
+        significance = np.asarray(result.significance_level, dtype=np.float64) / 100
+        return float(result.statistic), float(np.interp(result.statistic, result.critical_values, significance))
+    
     def brand_analysis(self) -> Dict[str, Any]:
         """Analyze brand distribution and characteristics."""
         if 'brand' not in self.data.columns:
@@ -186,7 +352,7 @@ class StatisticalAnalyzer:
         brand_analysis = {}
         
         # Brand market share
-        brand_counts = self.data['brand'].value_counts()
+        brand_counts = self.data['brand'].value_counts().head(10)
         total_products = len(self.data)
         
         brand_analysis['market_share'] = {
@@ -194,20 +360,20 @@ class StatisticalAnalyzer:
                 'count': int(count),
                 'percentage': float(count / total_products * 100)
             }
-            for brand, count in brand_counts.head(10).items()
+            for brand, count in brand_counts.items()
         }
         
         # Brand price analysis
-        if 'price' in self.data.columns:
-            brand_price_stats = self.data.groupby('brand')['price'].agg([
+        if self._price is not None:
+            brand_price_stats = self._price.groupby(self.data['brand'], observed=True).agg([
                 'count', 'mean', 'median', 'std', 'min', 'max'
             ]).round(2)
             
             brand_analysis['price_by_brand'] = brand_price_stats.to_dict('index')
             
             # Find premium vs budget brands
-            brand_avg_prices = self.data.groupby('brand')['price'].mean()
-            overall_median = self.data['price'].median()
+            brand_avg_prices = self._price.groupby(self.data['brand'], observed=True).mean()
+            overall_median = self._price.median()
             
             brand_analysis['brand_positioning'] = {
                 'premium_brands': brand_avg_prices[brand_avg_prices > overall_median * 1.5].index.tolist(),
@@ -236,57 +402,69 @@ class StatisticalAnalyzer:
         }
         
         # Category price analysis
-        if 'price' in self.data.columns:
-            cat_price_stats = self.data.groupby('category')['price'].agg([
+        if self._price is not None:
+            cat_price_stats = self._price.groupby(self.data['category'], observed=True).agg([
                 'count', 'mean', 'median', 'std', 'min', 'max'
             ]).round(2)
             
             category_analysis['price_statistics'] = cat_price_stats.to_dict('index')
             
             # Price comparison between categories
-            try:
-                categories = self.data['category'].unique()
-                if len(categories) > 1:
-                    price_comparison = {}
-                    for i, cat1 in enumerate(categories):
-                        for cat2 in categories[i+1:]:
-                            cat1_prices = self.data[self.data['category'] == cat1]['price'].dropna()
-                            cat2_prices = self.data[self.data['category'] == cat2]['price'].dropna()
-                            
-                            if len(cat1_prices) > 0 and len(cat2_prices) > 0:
+            categories = self.data['category'].unique()
+            if HAS_SCIPY and len(categories) > 1:
+                price_comparison = {}
+                for i, cat1 in enumerate(categories):
+                    for cat2 in categories[i+1:]:
+                        cat1_prices = self._price[self.data['category'] == cat1].dropna()
+                        cat2_prices = self._price[self.data['category'] == cat2].dropna()
+                        
+                        if len(cat1_prices) > 0 and len(cat2_prices) > 0:
+                            try:
                                 t_stat, p_value = stats.ttest_ind(cat1_prices, cat2_prices)
-                                price_comparison[f"{cat1}_vs_{cat2}"] = {
-                                    't_statistic': float(t_stat),
-                                    'p_value': float(p_value),
-                                    'significant_difference': bool(p_value < 0.05)
-                                }
-                    
-                    category_analysis['price_comparisons'] = price_comparison
-            except:
-                pass
+                            except ValueError as e:
+                                self.logger.warning(f"t-test {cat1} vs {cat2} skipped: {e}")
+                                continue
+                            price_comparison[f"{cat1}_vs_{cat2}"] = {
+                                't_statistic': float(t_stat),
+                                'p_value': float(p_value),
+                                'significant_difference': bool(p_value < 0.05)
+                            }
+                
+                category_analysis['price_comparisons'] = price_comparison
         
         return category_analysis
     
     def correlation_analysis(self) -> Dict[str, Any]:
         """Analyze correlations between numerical variables."""
-        numeric_columns = self.data.select_dtypes(include=[np.number]).columns.tolist()
+        numeric_data = self.data.select_dtypes(include=[np.number])
+        if self._price is not None:
+            numeric_data = numeric_data.assign(price=self._price)
+        numeric_columns = numeric_data.columns.tolist()
         
         if len(numeric_columns) < 2:
             return {'error': 'Insufficient numerical data for correlation analysis'}
         
-        correlation_matrix = self.data[numeric_columns].corr()
+        values = numeric_data.to_numpy(dtype=np.float64, na_value=np.nan)
+        if np.isnan(values).any():
+            # Pairwise-complete correlations are needed when values are missing
+            correlation_values = numeric_data.corr().to_numpy()
+        else:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                correlation_values = np.corrcoef(values, rowvar=False)
+        correlation_matrix = pd.DataFrame(correlation_values, index=numeric_columns, columns=numeric_columns)
         
         # Find strong correlations (> 0.7 or < -0.7)
-        strong_correlations = []
-        for i in range(len(correlation_matrix.columns)):
-            for j in range(i+1, len(correlation_matrix.columns)):
-                corr_value = correlation_matrix.iloc[i, j]
-                if abs(corr_value) > 0.7:
-                    strong_correlations.append({
-                        'variable1': correlation_matrix.columns[i],
-                        'variable2': correlation_matrix.columns[j],
-                        'correlation': float(corr_value)
-                    })
+        rows, cols = np.triu_indices(len(numeric_columns), k=1)
+        upper_values = correlation_values[rows, cols]
+        strong = np.abs(upper_values) > 0.7
+        strong_correlations = [
+            {
+                'variable1': numeric_columns[i],
+                'variable2': numeric_columns[j],
+                'correlation': float(corr_value)
+            }
+            for i, j, corr_value in zip(rows[strong], cols[strong], upper_values[strong])
+        ]
         
         return {
             'correlation_matrix': correlation_matrix.round(3).to_dict(),
@@ -296,11 +474,13 @@ class StatisticalAnalyzer:
     
     def time_series_analysis(self) -> Dict[str, Any]:
         """Analyze time-based patterns in the data."""
-        if 'createdat' not in self.data.columns:
+        if self._createdat is None:
             return {'error': 'No timestamp data available'}
         
-        time_data = self.data.copy()
-        time_data['createdat'] = pd.to_datetime(time_data['createdat'], errors='coerce')
+        # Build a narrow frame from the parsed columns instead of copying the full dataset
+        time_data = pd.DataFrame({'createdat': self._createdat})
+        if self._price is not None:
+            time_data['price'] = self._price
         time_data = time_data.dropna(subset=['createdat'])
         
         if len(time_data) == 0:
@@ -378,35 +558,22 @@ class StatisticalAnalyzer:
         }
         
         # Add all analysis components
-        try:
-            report['descriptive_statistics'] = self.descriptive_statistics()
-        except Exception as e:
-            self.logger.error(f"Error in descriptive statistics: {e}")
-        
-        try:
-            report['price_analysis'] = self.price_distribution_analysis()
-        except Exception as e:
-            self.logger.error(f"Error in price analysis: {e}")
-        
-        try:
-            report['brand_analysis'] = self.brand_analysis()
-        except Exception as e:
-            self.logger.error(f"Error in brand analysis: {e}")
-        
-        try:
-            report['category_analysis'] = self.category_analysis()
-        except Exception as e:
-            self.logger.error(f"Error in category analysis: {e}")
-        
-        try:
-            report['correlation_analysis'] = self.correlation_analysis()
-        except Exception as e:
-            self.logger.error(f"Error in correlation analysis: {e}")
-        
-        try:
-            report['time_analysis'] = self.time_series_analysis()
-        except Exception as e:
-            self.logger.error(f"Error in time series analysis: {e}")
+        sections = [
+            ('descriptive_statistics', 'descriptive statistics', self.descriptive_statistics),
+            ('price_analysis', 'price analysis', self.price_distribution_analysis),
+            ('brand_analysis', 'brand analysis', self.brand_analysis),
+            ('category_analysis', 'category analysis', self.category_analysis),
+            ('correlation_analysis', 'correlation analysis', self.correlation_analysis),
+            ('time_analysis', 'time series analysis', self.time_series_analysis)
+        ]
+        
+        for key, label, section in sections:
+            start = time.perf_counter()
+            try:
+                report[key] = section()
+            except Exception as e:
+                self.logger.error(f"Error in {label}: {e}")
+            self.logger.info('%s: %d rows in %.3fs', section.__name__, len(self.data), time.perf_counter() - start)
         
         return report
 
@@ -414,9 +581,38 @@ class StatisticalAnalyzer:
 class ComparativeAnalyzer:
     """Compare data across different sources, time periods, or categories."""
     
+    # Frames larger than this are spilled to Parquet so per-source scans can push filters down
+    PARQUET_SPILL_THRESHOLD = 100_000
+    
     def __init__(self, data: pd.DataFrame):
-        self.data = data.copy()
+        self.data = data
         self.logger = logging.getLogger(__name__)
+        self._parquet_dir = None
+        self._parquet_path: Optional[str] = None
+        
+        if HAS_DUCKDB and len(self.data) > self.PARQUET_SPILL_THRESHOLD:
+            self._spill_to_parquet()
+    
+    def _spill_to_parquet(self):
+        """Write the data to a temporary Parquet file for filtered DuckDB scans."""
+        try:
+            self._parquet_dir = tempfile.TemporaryDirectory(prefix='ecommerce_analysis_')
+            parquet_path = os.path.join(self._parquet_dir.name, 'data.parquet')
+            self.data.to_parquet(parquet_path, compression='zstd', index=False)
+            self._parquet_path = parquet_path
+        except Exception as e:
+            self.logger.warning(f"Parquet spill failed, using in-memory filtering: {e}")
+            self._parquet_dir = None
+            self._parquet_path = None
+    
+    def _load_source(self, source: str) -> pd.DataFrame:
+        """Load the records of a single source, reading only its row groups when spilled."""
+        if self._parquet_path is None:
+            return self.data[self.data['source'] == source]
+        
+        return duckdb.execute(
+            "SELECT * FROM read_parquet(?) WHERE source = ?", [self._parquet_path, source]
+        ).df()
     
     def compare_sources(self) -> Dict[str, Any]:
         """Compare metrics across different data sources."""
@@ -427,7 +623,7 @@ class ComparativeAnalyzer:
         sources = self.data['source'].unique()
         
         for source in sources:
-            source_data = self.data[self.data['source'] == source]
+            source_data = self._load_source(source)
             analyzer = StatisticalAnalyzer(source_data)
             
             comparison[source] = {
@@ -442,8 +638,10 @@ class ComparativeAnalyzer:
         if 'createdat' not in self.data.columns:
             return {'error': 'No timestamp data available'}
         
-        time_data = self.data.copy()
-        time_data['createdat'] = pd.to_datetime(time_data['createdat'], errors='coerce')
+        columns = [col for col in ('price', 'category') if col in self.data.columns]
+        time_data = self.data[columns].assign(
+            createdat=pd.to_datetime(self.data['createdat'], errors='coerce')
+        )
         time_data = time_data.dropna(subset=['createdat'])
         
         if period == 'daily':
@@ -455,14 +653,23 @@ class ComparativeAnalyzer:
         else:
             return {'error': f'Unsupported period: {period}'}
         
+        # One grouped pass per metric instead of masking the frame once per period
+        grouped = time_data.groupby('period', sort=False)
+        record_counts = grouped.size()
+        avg_prices = grouped['price'].mean() if 'price' in time_data.columns else None
+        
+        period_categories = {}
+        if 'category' in time_data.columns:
+            category_counts = time_data.groupby(['period', 'category'], sort=False, observed=True).size()
+            for (period_value, category), count in category_counts.sort_values(ascending=False, kind='stable').items():
+                period_categories.setdefault(period_value, {})[category] = int(count)
+        
         comparison = {}
-        for period_value in time_data['period'].unique():
-            period_data = time_data[time_data['period'] == period_value]
-            
+        for period_value, record_count in record_counts.items():
             comparison[str(period_value)] = {
-                'record_count': len(period_data),
-                'avg_price': float(period_data['price'].mean()) if 'price' in period_data.columns else None,
-                'categories': period_data['category'].value_counts().to_dict() if 'category' in period_data.columns else {}
+                'record_count': int(record_count),
+                'avg_price': float(avg_prices[period_value]) if avg_prices is not None else None,
+                'categories': period_categories.get(period_value, {})
             }
         
         return comparison
\ No newline at end of file
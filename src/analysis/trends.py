@@ -10,43 +10,54 @@ import seaborn as sns
 from scipy import stats
 from typing import Dict, List, Any, Optional, Tuple
 import logging
+import time
 from datetime import datetime, timedelta
-import warnings
-warnings.filterwarnings('ignore')
 
 class TrendAnalyzer:
     """Analyze trends and patterns in e-commerce data over time."""
     
     def __init__(self, data: pd.DataFrame):
-        self.data = data.copy()
+        # Keep a reference to the caller's frame; only the columns used for trends are materialized.
+        self.data = data
         self.logger = logging.getLogger(__name__)
+        self._createdat: Optional[pd.Series] = None
+        self._price: Optional[pd.Series] = None
+        self._time_data = pd.DataFrame()
         self._prepare_data()
     
     def _prepare_data(self):
         """Prepare data for trend analysis."""
+        if 'price' in self.data.columns:
+            self._price = pd.to_numeric(self.data['price'], errors='coerce')
+        
         if 'createdat' in self.data.columns:
-            self.data['createdat'] = pd.to_datetime(self.data['createdat'], errors='coerce')
-            self.data = self.data.dropna(subset=['createdat'])
+            self._createdat = pd.to_datetime(self.data['createdat'], errors='coerce')
+            
+            # Narrow frame holding only the valid timestamps and the columns trends need
+            time_data = pd.DataFrame({'createdat': self._createdat})
+            if self._price is not None:
+                time_data['price'] = self._price
+            if 'category' in self.data.columns:
+                time_data['category'] = self.data['category']
+            time_data = time_data.dropna(subset=['createdat'])
             
             # Add time-based features
-            self.data['date'] = self.data['createdat'].dt.date
-            self.data['hour'] = self.data['createdat'].dt.hour
-            self.data['weekday'] = self.data['createdat'].dt.day_name()
-            self.data['month'] = self.data['createdat'].dt.month
-            self.data['week'] = self.data['createdat'].dt.isocalendar().week
-        
-        if 'price' in self.data.columns:
-            self.data['price'] = pd.to_numeric(self.data['price'], errors='coerce')
+            time_data['date'] = time_data['createdat'].dt.date
+            time_data['hour'] = time_data['createdat'].dt.hour
+            time_data['weekday'] = time_data['createdat'].dt.day_name()
+            time_data['month'] = time_data['createdat'].dt.month
+            time_data['week'] = time_data['createdat'].dt.isocalendar().week
+            self._time_data = time_data
     
     def price_trends(self) -> Dict[str, Any]:
         """Analyze price trends over time."""
-        if 'price' not in self.data.columns or 'createdat' not in self.data.columns:
+        if self._price is None or self._createdat is None:
             return {'error': 'Price or timestamp data not available'}
         
         trends = {}
         
         # Daily price trends
-        daily_prices = self.data.groupby('date')['price'].agg(['mean', 'median', 'count', 'std']).reset_index()
+        daily_prices = self._time_data.groupby('date')['price'].agg(['mean', 'median', 'count', 'std']).reset_index()
         daily_prices = daily_prices.dropna()
         
         if len(daily_prices) > 1:
@@ -72,10 +83,10 @@ class TrendAnalyzer:
             }
         
         # Category-specific price trends
-        if 'category' in self.data.columns:
+        if 'category' in self._time_data.columns:
             category_trends = {}
-            for category in self.data['category'].unique():
-                cat_data = self.data[self.data['category'] == category]
+            for category in self._time_data['category'].unique():
+                cat_data = self._time_data[self._time_data['category'] == category]
                 cat_daily = cat_data.groupby('date')['price'].mean().reset_index()
                 
                 if len(cat_daily) > 1:
@@ -95,13 +106,13 @@ class TrendAnalyzer:
     
     def volume_trends(self) -> Dict[str, Any]:
         """Analyze scraping volume trends over time."""
-        if 'createdat' not in self.data.columns:
+        if self._createdat is None:
             return {'error': 'Timestamp data not available'}
         
         volume_trends = {}
         
         # Daily volume trends
-        daily_counts = self.data.groupby('date').size().reset_index(name='count')
+        daily_counts = self._time_data.groupby('date').size().reset_index(name='count')
         
         if len(daily_counts) > 1:
             x = np.arange(len(daily_counts))
@@ -118,7 +129,7 @@ class TrendAnalyzer:
             }
         
         # Hourly patterns
-        hourly_counts = self.data.groupby('hour').size()
+        hourly_counts = self._time_data.groupby('hour').size()
         volume_trends['hourly_patterns'] = {
             'peak_hours': hourly_counts.nlargest(3).index.tolist(),
             'low_hours': hourly_counts.nsmallest(3).index.tolist(),
@@ -126,7 +137,7 @@ class TrendAnalyzer:
         }
         
         # Weekly patterns
-        weekday_counts = self.data.groupby('weekday').size()
+        weekday_counts = self._time_data.groupby('weekday').size()
         volume_trends['weekly_patterns'] = {
             'busiest_days': weekday_counts.nlargest(3).index.tolist(),
             'quietest_days': weekday_counts.nsmallest(3).index.tolist(),
@@ -140,20 +151,23 @@ class TrendAnalyzer:
         report = {
             'analysis_timestamp': datetime.now().isoformat(),
             'data_period': {
-                'start_date': str(self.data['date'].min()) if 'date' in self.data.columns else None,
-                'end_date': str(self.data['date'].max()) if 'date' in self.data.columns else None,
-                'total_days': (self.data['date'].max() - self.data['date'].min()).days if 'date' in self.data.columns else None
+                'start_date': str(self._time_data['date'].min()) if 'date' in self._time_data.columns else None,
+                'end_date': str(self._time_data['date'].max()) if 'date' in self._time_data.columns else None,
+                'total_days': (self._time_data['date'].max() - self._time_data['date'].min()).days if 'date' in self._time_data.columns else None
             }
         }
         
-        try:
-            report['price_trends'] = self.price_trends()
-        except Exception as e:
-            self.logger.error(f"Error in price trends: {e}")
+        sections = [
+            ('price_trends', 'price trends', self.price_trends),
+            ('volume_trends', 'volume trends', self.volume_trends)
+        ]
         
-        try:
-            report['volume_trends'] = self.volume_trends()
-        except Exception as e:
-            self.logger.error(f"Error in volume trends: {e}")
+        for key, label, section in sections:
+            start = time.perf_counter()
+            try:
+                report[key] = section()
+            except Exception as e:
+                self.logger.error(f"Error in {label}: {e}")
+            self.logger.info('%s: %d rows in %.3fs', section.__name__, len(self._time_data), time.perf_counter() - start)
         
         return report
\ No newline at end of file
@@ -8,10 +8,23 @@ DB_HOST = "localhost"
 DB_PORT = "5432"
 DB_NAME = "ecommerce_db"
 
-DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+DATABASE_URL = f"postgresql+psycopg2://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(bind=engine)
+INSERT_BATCH_SIZE = 1000
+
+# Pooled connections; psycopg2 sends executemany() batches as multi-row VALUES pages
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=20,
+    max_overflow=40,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    isolation_level="READ COMMITTED",
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=INSERT_BATCH_SIZE,
+)
+# expire_on_commit=False avoids a refresh SELECT per object after each commit
+SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)
 
 def init_db():
     Base.metadata.create_all(engine)
@@ -1,19 +1,24 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Numeric, Index
 from sqlalchemy.ext.declarative import declarative_base
-from datetime import datetime
+from datetime import datetime, timezone
 
 Base = declarative_base()
 
 class Product(Base):
     __tablename__ = "products"
+    __table_args__ = (
+        Index('ix_products_cat_brand', 'category', 'brand'),
+        # BRIN stays tiny on append-mostly scrape tables and serves time-range scans
+        Index('ix_products_created_at_brin', 'created_at', postgresql_using='brin'),
+    )
 
     id = Column(Integer, primary_key=True)
-    name = Column(String, nullable=False)
-    price = Column(String)
+    name = Column(String, nullable=False, index=True)
+    price = Column(Numeric(12, 2))
     brand = Column(String)
     category = Column(String)
     description = Column(String)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
 
     def __repr__(self):
         return f"<Product(name='{self.name}', brand='{self.brand}', category='{self.category}')>"
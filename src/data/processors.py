@@ -3,22 +3,104 @@ import pandas as pd
 import numpy as np
 import re
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 import logging
+import multiprocessing as mp
+from functools import partial
 from pathlib import Path
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+try:
+    import xlsxwriter
+    EXCEL_ENGINE = 'xlsxwriter'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# orjson errors subclass ValueError, so callers catch the same exception either way
+json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Arrow-backed strings route .str methods to Arrow's compiled kernels
+TEXT_DTYPE = 'string[pyarrow]' if HAS_PYARROW else 'string'
+
+# Storage and RAM specs in one scan of the product name; each lookahead
+# searches the whole name independently so the groups don't compete
+NAME_FEATURES_PATTERN = re.compile(
+    r'^(?=(?:.*?(?P<storage>\d+)GB)?)'
+    r'(?=(?:.*?(?P<storage_tb>\d+)TB)?)'
+    r'(?=(?:.*?(?P<ram>\d+)GB.*RAM|.*?RAM\s*(?P<ram_after>\d+)GB)?)'
+)
+
+# The same features for Arrow's RE2 engine, which has no lookaheads: one C++ pass each
+NAME_FEATURE_PATTERNS_RE2 = {
+    'storage': r'(?P<value>\d+)GB',
+    'storage_tb': r'(?P<value>\d+)TB',
+    'ram': r'(?P<value>\d+)GB.*RAM',
+    'ram_after': r'RAM\s*(?P<value>\d+)GB',
+}
+
+RAW_CHUNK_SIZE = 10_000
+
+def _quality_scores(short_desc: np.ndarray, short_name: np.ndarray, missing_storage: np.ndarray) -> np.ndarray:
+    """Score records from 0-100 given per-record penalty flags (int8 0/1 arrays)."""
+    scores = 100 - 20 * short_desc.astype(np.int16) - 15 * short_name.astype(np.int16) - 10 * missing_storage.astype(np.int16)
+    return np.maximum(scores, 0)
+
+
+# Storage/RAM sizes in GB fit in uint16; anything larger is not a real spec
+SPEC_SIZE_DTYPE = 'UInt16'
+SPEC_SIZE_MAX = np.iinfo(np.uint16).max
+
+
+def _to_spec_size(values: np.ndarray) -> pd.arrays.IntegerArray:
+    """Store extracted GB sizes as nullable uint16, treating out-of-range values as missing."""
+    return pd.array(np.where(values <= SPEC_SIZE_MAX, values, np.nan), dtype=SPEC_SIZE_DTYPE)
+
+
+WEEKDAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Low-cardinality label columns stored as categoricals (int codes instead of Python strs)
+CATEGORICAL_FIELDS = ('category', 'source')
+
+
+def _process_file_worker(config: Dict, output_dir: Optional[str], input_path: str) -> Dict[str, Any]:
+    """Process one file in a pool worker with its own DataProcessor."""
+    return DataProcessor(config).process_file(input_path, output_dir)
+
+
 class DataProcessor:
 
     def __init__(self, config: Optional[Dict] = None):
         self.config = config or {}
         self.logger = logging.getLogger(__name__)
         self.validation_rules = self._init_validation_rules()
+        self._required_set = frozenset(self.validation_rules['required_fields'])
+        self._valid_categories = frozenset(self.validation_rules['valid_categories'])
+        self._valid_sources = frozenset(self.validation_rules['valid_sources'])
         
     def _init_validation_rules(self) -> Dict:
         """Initialize data validation rules."""
         return {
             'required_fields': ['source', 'name', 'price', 'brand', 'category', 'createdat'],
-            'price_range': {'min': 0, 'max': 50000},  # GEL
+            # GEL; prices stay float64 since they carry tetri and feed means/stds
+            'price_range': {'min': 0, 'max': 50000},
             'valid_categories': ['phones', 'laptops', 'fridges', 'tvs'],
             'valid_sources': ['zoommer.ge', 'alta.ge', 'ee.ge'],
             'name_min_length': 3,
@@ -28,13 +110,18 @@ class DataProcessor:
     def load_raw_data(self, file_path: str) -> pd.DataFrame:
         """Load raw JSON data and convert to DataFrame."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            chunks = list(self.iter_raw_data(file_path))
+            df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
             
-            if not isinstance(data, list):
-                data = [data]
-                
-            df = pd.DataFrame(data)
+            # Store text as contiguous string buffers instead of one Python str per cell
+            for field in df.columns[df.dtypes == object]:
+                if pd.api.types.infer_dtype(df[field], skipna=True) == 'string':
+                    df[field] = df[field].astype(TEXT_DTYPE)
+            
+            # Cast after the concat: chunks with different categories would concat back to object
+            for field in CATEGORICAL_FIELDS:
+                if field in df.columns:
+                    df[field] = df[field].astype('category')
             self.logger.info(f"Loaded {len(df)} records from {file_path}")
             return df
             
@@ -42,91 +129,143 @@ class DataProcessor:
             self.logger.error(f"Error loading data from {file_path}: {e}")
             return pd.DataFrame()
     
+    def iter_raw_data(self, file_path: str, chunksize: int = RAW_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """Yield raw records as DataFrames of at most chunksize rows.
+        
+        Handles JSON arrays (streamed with ijson when installed), JSON Lines
+        and single JSON objects, so the whole file is never held as Python objects.
+        """
+        with open(file_path, 'r', encoding='utf-8') as f:
+            # Sniff the format from the first non-blank line; leading blank lines are valid JSON
+            first_line = next((line for line in f if line.strip()), '')
+            f.seek(0)
+            stripped = first_line.lstrip()
+            
+            if stripped.startswith('['):
+                if HAS_IJSON:
+                    # ijson parses bytes; a text handle would make it re-encode every read
+                    with open(file_path, 'rb') as raw:
+                        batch = []
+                        for record in ijson.items(raw, 'item', use_float=True):
+                            batch.append(record)
+                            if len(batch) >= chunksize:
+                                yield pd.DataFrame.from_records(batch)
+                                batch = []
+                        if batch:
+                            yield pd.DataFrame.from_records(batch)
+                else:
+                    data = json_loads(f.read())
+                    for start in range(0, len(data), chunksize):
+                        yield pd.DataFrame(data[start:start + chunksize])
+                return
+            
+            if stripped and self._is_json_line(first_line):
+                yield from pd.read_json(f, lines=True, chunksize=chunksize, dtype=False, convert_dates=False)
+                return
+            
+            data = json_loads(f.read())
+            yield pd.DataFrame(data if isinstance(data, list) else [data])
+    
+    @staticmethod
+    def _is_json_line(line: str) -> bool:
+        """Check whether a line holds a complete JSON document on its own."""
+        try:
+            json_loads(line)
+            return True
+        except ValueError:
+            return False
+    
     def validate_data(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
         """Validate data against predefined rules and return cleaned data + validation report."""
         validation_report = {
             'total_records': len(df),
             'valid_records': 0,
-            'issues': {
-                'missing_fields': [],
-                'invalid_prices': [],
-                'invalid_categories': [],
-                'invalid_sources': [],
-                'invalid_names': [],
-                'invalid_brands': [],
-                'invalid_dates': []
-            }
+            # Each issue holds the failing row labels; format_report builds the messages
+            'issues': {issue: self._issue(df.index[:0]) for issue in (
+                'missing_fields', 'invalid_prices', 'invalid_categories', 'invalid_sources',
+                'invalid_names', 'invalid_brands', 'invalid_dates'
+            )}
         }
         
         if df.empty:
             return df, validation_report
         
         # Check required fields
-        missing_fields = set(self.validation_rules['required_fields']) - set(df.columns)
+        cols = frozenset(df.columns)
+        missing_fields = self._required_set - cols
         if missing_fields:
-            validation_report['issues']['missing_fields'] = list(missing_fields)
+            validation_report['issues']['missing_fields']['columns'] = sorted(missing_fields)
             self.logger.warning(f"Missing required fields: {missing_fields}")
         
-        # Validate each record
-        valid_indices = []
-        
-        for idx, row in df.iterrows():
-            is_valid = True
-            
-            # Check for null values in required fields
-            for field in self.validation_rules['required_fields']:
-                if field in df.columns and (pd.isna(row[field]) or row[field] == ''):
-                    validation_report['issues']['missing_fields'].append(f"Row {idx}: missing {field}")
-                    is_valid = False
-            
-            # Validate price
-            if 'price' in df.columns:
-                try:
-                    price = float(row['price'])
-                    if not (self.validation_rules['price_range']['min'] <= price <= self.validation_rules['price_range']['max']):
-                        validation_report['issues']['invalid_prices'].append(f"Row {idx}: price {price} out of range")
-                        is_valid = False
-                except (ValueError, TypeError):
-                    validation_report['issues']['invalid_prices'].append(f"Row {idx}: invalid price format")
-                    is_valid = False
-            
-            # Validate category
-            if 'category' in df.columns and row['category'] not in self.validation_rules['valid_categories']:
-                validation_report['issues']['invalid_categories'].append(f"Row {idx}: invalid category '{row['category']}'")
-                is_valid = False
-            
-            # Validate source
-            if 'source' in df.columns and row['source'] not in self.validation_rules['valid_sources']:
-                validation_report['issues']['invalid_sources'].append(f"Row {idx}: invalid source '{row['source']}'")
-                is_valid = False
-            
-            # Validate name
-            if 'name' in df.columns:
-                name = str(row['name']).strip()
-                if len(name) < self.validation_rules['name_min_length']:
-                    validation_report['issues']['invalid_names'].append(f"Row {idx}: name too short")
-                    is_valid = False
-            
-            # Validate brand
-            if 'brand' in df.columns:
-                brand = str(row['brand']).strip()
-                if len(brand) < self.validation_rules['brand_min_length']:
-                    validation_report['issues']['invalid_brands'].append(f"Row {idx}: brand too short")
-                    is_valid = False
-            
-            # Validate date format
-            if 'createdat' in df.columns:
-                try:
-                    datetime.fromisoformat(row['createdat'].replace('Z', '+00:00'))
-                except (ValueError, TypeError, AttributeError):
-                    validation_report['issues']['invalid_dates'].append(f"Row {idx}: invalid date format")
-                    is_valid = False
-            
-            if is_valid:
-                valid_indices.append(idx)
+        # Validate all records with column-wise masks
+        rules = self.validation_rules
+        price_min, price_max = rules['price_range']['min'], rules['price_range']['max']
+        issues = validation_report['issues']
+        valid = pd.Series(True, index=df.index)
+        
+        # Check for null values in required fields
+        required_fields = [field for field in rules['required_fields'] if field in cols]
+        if required_fields:
+            required = df[required_fields]
+            missing = required.isna() | (required == '')
+            missing_cells = missing.stack()
+            missing_cells = missing_cells[missing_cells].index
+            issues['missing_fields'].update(self._issue(
+                missing_cells.get_level_values(0), fields=missing_cells.get_level_values(1)
+            ))
+            valid &= ~missing.any(axis=1)
+        
+        # Validate price
+        if 'price' in cols:
+            price = pd.to_numeric(df['price'], errors='coerce')
+            bad_format = price.isna()
+            out_of_range = ~bad_format & ~price.between(price_min, price_max)
+            invalid_price = bad_format | out_of_range
+            # Unparseable prices keep NaN as their value
+            issues['invalid_prices'] = self._issue(df.index[invalid_price], values=price[invalid_price])
+            valid &= ~invalid_price
+        
+        # Validate category
+        if 'category' in cols:
+            invalid_category = ~df['category'].isin(self._valid_categories)
+            issues['invalid_categories'] = self._issue(
+                df.index[invalid_category], values=df.loc[invalid_category, 'category']
+            )
+            valid &= ~invalid_category
+        
+        # Validate source
+        if 'source' in cols:
+            invalid_source = ~df['source'].isin(self._valid_sources)
+            issues['invalid_sources'] = self._issue(
+                df.index[invalid_source], values=df.loc[invalid_source, 'source']
+            )
+            valid &= ~invalid_source
+        
+        # Validate name
+        if 'name' in cols:
+            short_name = df['name'].astype(str).str.strip().str.len() < rules['name_min_length']
+            issues['invalid_names'] = self._issue(df.index[short_name])
+            valid &= ~short_name
+        
+        # Validate brand
+        if 'brand' in cols:
+            short_brand = df['brand'].astype(str).str.strip().str.len() < rules['brand_min_length']
+            issues['invalid_brands'] = self._issue(df.index[short_brand])
+            valid &= ~short_brand
+        
+        # Validate date format
+        parsed_dates = None
+        if 'createdat' in cols:
+            parsed_dates = self._parse_timestamps(df['createdat'])
+            invalid_date = parsed_dates.isna()
+            issues['invalid_dates'] = self._issue(df.index[invalid_date])
+            valid &= ~invalid_date
         
         # Filter to valid records
-        clean_df = df.loc[valid_indices].copy()
+        clean_df = df.loc[valid].copy()
+        if parsed_dates is not None:
+            # Keep the parsed timestamps so clean_data doesn't parse the column again
+            clean_df['createdat_parsed'] = parsed_dates[valid]
         validation_report['valid_records'] = len(clean_df)
         validation_report['validation_rate'] = len(clean_df) / len(df) if len(df) > 0 else 0
         
@@ -134,23 +273,96 @@ class DataProcessor:
         
         return clean_df, validation_report
     
+    @staticmethod
+    def _issue(indices: pd.Index, **values) -> Dict[str, Any]:
+        """Build a validation issue entry from failing row labels and any per-row values."""
+        issue = {'count': len(indices), 'indices': indices.to_numpy()}
+        issue.update({key: np.asarray(value) for key, value in values.items()})
+        return issue
+    
+    @staticmethod
+    def format_report(validation_report: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a copy of a validation report with issues rendered as message lists."""
+        issues = validation_report['issues']
+        missing = issues['missing_fields']
+        prices = issues['invalid_prices']
+        
+        formatted_issues = {
+            'missing_fields': list(missing.get('columns', [])) + [
+                f"Row {idx}: missing {field}" for idx, field in zip(missing['indices'], missing.get('fields', []))
+            ],
+            'invalid_prices': [
+                f"Row {idx}: invalid price format" if np.isnan(value) else f"Row {idx}: price {value} out of range"
+                for idx, value in zip(prices['indices'], prices.get('values', []))
+            ],
+            'invalid_categories': [
+                f"Row {idx}: invalid category '{value}'"
+                for idx, value in zip(issues['invalid_categories']['indices'], issues['invalid_categories'].get('values', []))
+            ],
+            'invalid_sources': [
+                f"Row {idx}: invalid source '{value}'"
+                for idx, value in zip(issues['invalid_sources']['indices'], issues['invalid_sources'].get('values', []))
+            ],
+            'invalid_names': [f"Row {idx}: name too short" for idx in issues['invalid_names']['indices']],
+            'invalid_brands': [f"Row {idx}: brand too short" for idx in issues['invalid_brands']['indices']],
+            'invalid_dates': [f"Row {idx}: invalid date format" for idx in issues['invalid_dates']['indices']],
+        }
+        
+        return {**validation_report, 'issues': formatted_issues}
+    
+    @staticmethod
+    def _parse_timestamps(values: pd.Series) -> pd.Series:
+        """Parse ISO 8601 timestamp strings and datetime objects to UTC; anything else becomes NaT."""
+        parsed = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns, UTC]')
+        if not (pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values)):
+            return parsed
+        
+        if pd.api.types.infer_dtype(values, skipna=True) == 'string':
+            string_positions = np.arange(len(values))
+        else:
+            # Object columns can mix strings with datetime/Timestamp objects (e.g. mixed offsets)
+            is_datetime = values.map(lambda value: isinstance(value, (datetime, np.datetime64))).to_numpy(dtype=bool)
+            if is_datetime.any():
+                parsed.iloc[is_datetime] = pd.to_datetime(values[is_datetime], errors='coerce', utc=True).array
+            string_positions = np.flatnonzero(values.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool))
+        
+        iso_values = values.iloc[string_positions].str.replace('Z', '+00:00', regex=False)
+        
+        # pandas carries an earlier row's offset over to naive strings in a
+        # mixed column, so offset-aware and naive values are parsed apart
+        has_offset = iso_values.str.contains(r'[+-]\d{2}:?\d{2}$', na=False).to_numpy(dtype=bool)
+        for mask in (has_offset, ~has_offset):
+            if mask.any():
+                parsed.iloc[string_positions[mask]] = pd.to_datetime(
+                    iso_values[mask], format='ISO8601', errors='coerce', utc=True
+                ).array
+        return parsed
+    
     def clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and standardize data."""
         if df.empty:
             return df
         
-        cleaned_df = df.copy()
+        cols = frozenset(df.columns)
+        # Shallow copy: columns are replaced wholesale below, never written in place,
+        # so the caller's frame is left untouched without duplicating its data
+        cleaned_df = df.copy(deep=False)
         
         # Clean text fields
         text_fields = ['name', 'brand', 'description']
         for field in text_fields:
-            if field in cleaned_df.columns:
-                cleaned_df[field] = cleaned_df[field].astype(str).str.strip()
+            if field in cols:
+                cleaned_df[field] = cleaned_df[field].astype(TEXT_DTYPE).str.strip()
                 # Remove extra whitespace
                 cleaned_df[field] = cleaned_df[field].str.replace(r'\s+', ' ', regex=True)
         
+        # Store label columns as categoricals, dropping labels only invalid rows used
+        for field in (*CATEGORICAL_FIELDS, 'brand'):
+            if field in cols:
+                cleaned_df[field] = cleaned_df[field].astype('category').cat.remove_unused_categories()
+        
         # Standardize prices
-        if 'price' in cleaned_df.columns:
+        if 'price' in cols:
             cleaned_df['price'] = pd.to_numeric(cleaned_df['price'], errors='coerce')
         
         # Parse and standardize dates
@@ -161,27 +373,38 @@ class DataProcessor:
         #     cleaned_df['scrape_hour'] = cleaned_df['createdat'].dt.hour
         #     cleaned_df['scrape_weekday'] = cleaned_df['createdat'].dt.day_name()
         #
-        if 'createdat' in cleaned_df.columns:
-            cleaned_df['createdat'] = pd.to_datetime(cleaned_df['createdat'], errors='coerce')
+        if 'createdat' in cols:
+            if 'createdat_parsed' in cols:
+                cleaned_df['createdat'] = cleaned_df.pop('createdat_parsed')
+            else:
+                cleaned_df['createdat'] = pd.to_datetime(cleaned_df['createdat'], errors='coerce')
             # ✅ Make timezone naive for Excel export
-            if pd.api.types.is_datetime64tz_dtype(cleaned_df['createdat']):
+            if isinstance(cleaned_df['createdat'].dtype, pd.DatetimeTZDtype):
                 cleaned_df['createdat'] = cleaned_df['createdat'].dt.tz_localize(None)
-            # Add derived date fields
-            cleaned_df['scrape_date'] = cleaned_df['createdat'].dt.date
+            # Add derived date fields from one day-resolution array instead of
+            # object columns of date objects and day-name strings
+            days = cleaned_df['createdat'].to_numpy().astype('datetime64[D]')
+            day_numbers = days.view('int64')
+            # 1970-01-01 was a Thursday (index 3); NaT gets code -1
+            weekday_codes = np.where(np.isnat(days), -1, (day_numbers + 3) % 7).astype(np.int8)
+            cleaned_df['scrape_date'] = days
             cleaned_df['scrape_hour'] = cleaned_df['createdat'].dt.hour
-            cleaned_df['scrape_weekday'] = cleaned_df['createdat'].dt.day_name()
+            cleaned_df['scrape_weekday'] = pd.Categorical.from_codes(weekday_codes, categories=WEEKDAY_NAMES)
 
 
         # Extract features from product names
-        if 'name' in cleaned_df.columns:
-            # Extract storage capacity (GB/TB)
-            cleaned_df['storage_gb'] = cleaned_df['name'].str.extract(r'(\d+)GB', expand=False).astype(float)
-            cleaned_df['storage_tb'] = cleaned_df['name'].str.extract(r'(\d+)TB', expand=False).astype(float)
-            # Convert TB to GB
-            cleaned_df.loc[cleaned_df['storage_tb'].notna(), 'storage_gb'] = cleaned_df['storage_tb'] * 1024
+        if 'name' in cols:
+            features = self._extract_name_features(cleaned_df['name'])
+            storage_tb = features['storage_tb'].to_numpy()
+            
+            # Extract storage capacity (GB/TB), converting TB to GB
+            cleaned_df['storage_gb'] = _to_spec_size(
+                np.where(np.isnan(storage_tb), features['storage'].to_numpy(), storage_tb * 1024)
+            )
+            cleaned_df['storage_tb'] = _to_spec_size(storage_tb)
             
             # Extract RAM (for laptops)
-            cleaned_df['ram_gb'] = cleaned_df['name'].str.extract(r'(\d+)GB.*RAM|RAM.*(\d+)GB', expand=False)[0].astype(float)
+            cleaned_df['ram_gb'] = _to_spec_size(features['ram'].fillna(features['ram_after']).to_numpy())
         
         # Add data quality score
         cleaned_df['data_quality_score'] = self._calculate_quality_score(cleaned_df)
@@ -190,32 +413,45 @@ class DataProcessor:
         
         return cleaned_df
     
+    @staticmethod
+    def _extract_name_features(names: pd.Series) -> pd.DataFrame:
+        """Extract storage and RAM numbers from product names as float columns."""
+        if not HAS_PYARROW:
+            return names.str.extract(NAME_FEATURES_PATTERN).astype(float)
+        
+        # Regex match and string-to-number cast both stay inside Arrow kernels
+        arrow_names = pa.array(names.astype(TEXT_DTYPE))
+        return pd.DataFrame({
+            feature: pc.cast(
+                pc.struct_field(pc.extract_regex(arrow_names, pattern=pattern), [0]), pa.float64()
+            ).to_numpy(zero_copy_only=False)
+            for feature, pattern in NAME_FEATURE_PATTERNS_RE2.items()
+        }, index=names.index)
+    
     def _calculate_quality_score(self, df: pd.DataFrame) -> pd.Series:
         """Calculate data quality score for each record (0-100)."""
-        scores = pd.Series(100, index=df.index)  # Start with perfect score
+        no_penalty = np.zeros(len(df), dtype=np.int8)
+        short_desc = short_name = missing_storage = no_penalty
         
         # Deduct points for missing or poor quality data
         if 'description' in df.columns:
-            # Deduct points for short descriptions
-            short_desc = df['description'].str.len() < 50
-            scores.loc[short_desc] -= 20
+            # Deduct points for short or missing descriptions
+            short_desc = (df['description'].str.len() < 50).to_numpy(dtype=np.int8, na_value=1)
         
         if 'name' in df.columns:
-            # Deduct points for very short names
-            short_name = df['name'].str.len() < 10
-            scores.loc[short_name] -= 15
+            # Deduct points for very short or missing names
+            short_name = (df['name'].str.len() < 10).to_numpy(dtype=np.int8, na_value=1)
         
         # Deduct points for missing derived features
         if 'storage_gb' in df.columns:
-            missing_storage = df['storage_gb'].isna()
-            scores.loc[missing_storage] -= 10
+            missing_storage = df['storage_gb'].isna().to_numpy(dtype=np.int8)
         
-        return scores.clip(lower=0)
+        return pd.Series(_quality_scores(short_desc, short_name, missing_storage), index=df.index)
     
     def export_data(self, df: pd.DataFrame, output_path: str, formats: List[str] = None) -> Dict[str, str]:
-        """Export cleaned data in multiple formats."""
+        """Export cleaned data in multiple formats (Parquet unless others are requested)."""
         if formats is None:
-            formats = ['json', 'csv', 'excel']
+            formats = ['parquet']
         
         exported_files = {}
         base_path = Path(output_path)
@@ -225,19 +461,24 @@ class DataProcessor:
         
         for fmt in formats:
             try:
-                if fmt == 'json':
+                if fmt == 'parquet':
+                    file_path = f"{base_path}_{timestamp}.parquet"
+                    df.to_parquet(file_path, engine='pyarrow', compression='zstd', index=False)
+                    exported_files['parquet'] = file_path
+                    
+                elif fmt == 'json':
                     file_path = f"{base_path}_{timestamp}.json"
                     df.to_json(file_path, orient='records', date_format='iso', indent=2)
                     exported_files['json'] = file_path
                     
                 elif fmt == 'csv':
                     file_path = f"{base_path}_{timestamp}.csv"
-                    df.to_csv(file_path, index=False, encoding='utf-8')
+                    df.to_csv(file_path, index=False, encoding='utf-8', lineterminator='\n')
                     exported_files['csv'] = file_path
                     
                 elif fmt == 'excel':
                     file_path = f"{base_path}_{timestamp}.xlsx"
-                    df.to_excel(file_path, index=False, engine='openpyxl')
+                    df.to_excel(file_path, index=False, engine=EXCEL_ENGINE)
                     exported_files['excel'] = file_path
                     
                 self.logger.info(f"Exported {len(df)} records to {file_path}")
@@ -280,6 +521,24 @@ class DataProcessor:
         }
         
         return processing_report
+    
+    def process_files(self, input_paths: List[str], output_dir: str = None,
+                      num_proc: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Run process_file over several files, one worker process per file."""
+        if not input_paths:
+            return []
+        
+        num_proc = min(num_proc or mp.cpu_count(), len(input_paths))
+        worker = partial(_process_file_worker, self.config, output_dir)
+        
+        if num_proc == 1:
+            return [worker(path) for path in input_paths]
+        
+        with mp.Pool(num_proc) as pool:
+            reports = pool.map(worker, input_paths)
+        
+        self.logger.info(f"Processed {len(reports)} files with {num_proc} workers")
+        return reports
 
 
 class DataAggregator:
@@ -289,23 +548,31 @@ class DataAggregator:
     
     def aggregate_files(self, file_paths: List[str]) -> pd.DataFrame:
         """Aggregate multiple processed data files."""
-        all_dfs = []
+        # Chunks from every file are concatenated once, so no per-file frame is copied twice
+        all_chunks = []
+        loaded_files = 0
         processor = DataProcessor()
         
         for file_path in file_paths:
             try:
-                df = processor.load_raw_data(file_path)
-                if not df.empty:
-                    df['source_file'] = file_path
-                    all_dfs.append(df)
+                if str(file_path).endswith('.parquet'):
+                    file_chunks = [pd.read_parquet(file_path)]
+                else:
+                    file_chunks = list(processor.iter_raw_data(file_path))
             except Exception as e:
                 self.logger.error(f"Error loading {file_path}: {e}")
+                continue
+            
+            file_chunks = [chunk.assign(source_file=file_path) for chunk in file_chunks if not chunk.empty]
+            if file_chunks:
+                all_chunks.extend(file_chunks)
+                loaded_files += 1
         
-        if not all_dfs:
+        if not all_chunks:
             return pd.DataFrame()
         
-        combined_df = pd.concat(all_dfs, ignore_index=True)
-        self.logger.info(f"Aggregated {len(combined_df)} records from {len(all_dfs)} files")
+        combined_df = pd.concat(all_chunks, ignore_index=True)
+        self.logger.info(f"Aggregated {len(combined_df)} records from {loaded_files} files")
         
         return combined_df
     
@@ -321,8 +588,14 @@ class DataAggregator:
         if all(col in df.columns for col in duplicate_cols):
             # Keep the most recent record for duplicates
             if 'createdat' in df.columns:
-                df_sorted = df.sort_values('createdat', ascending=False)
-                deduped_df = df_sorted.drop_duplicates(subset=duplicate_cols, keep='first')
+                created = df['createdat']
+                if not pd.api.types.is_datetime64_any_dtype(created):
+                    created = DataProcessor._parse_timestamps(created)
+                # NaT is the smallest int64, so undated rows only win when no dated duplicate exists
+                created = pd.Series(created.values.view('int64'))
+                keys = [df[col].to_numpy() for col in duplicate_cols]
+                latest = created.groupby(keys, sort=False, dropna=False).idxmax().to_numpy()
+                deduped_df = df.iloc[np.sort(latest)]
             else:
                 deduped_df = df.drop_duplicates(subset=duplicate_cols, keep='first')
         else:
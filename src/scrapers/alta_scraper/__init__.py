@@ -2,9 +2,18 @@
 Alta.ge Scraper Package
 """
 
-from alta_selenium_scraper import AltaScraper
 from alta_config import AltaConfig
-from alta_utilities import AltaUtilities
 
 __version__ = "1.0.0"
-__all__ = ["AltaScraper", "AltaConfig", "AltaUtilities"]
\ No newline at end of file
+__all__ = ["AltaScraper", "AltaConfig", "AltaUtilities"]
+
+
+def __getattr__(name):
+    # Selenium is only imported once a scraper or utility is actually used
+    if name == "AltaScraper":
+        from alta_selenium_scraper import AltaScraper
+        return AltaScraper
+    if name == "AltaUtilities":
+        from alta_utilities import AltaUtilities
+        return AltaUtilities
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,5 +1,22 @@
 import logging
-from typing import Dict, Tuple
+import re
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Tuple
+
+
+def _merge_selectors(specific: Dict[str, Dict[str, list]], defaults: Dict[str, list]) -> Dict[str, Dict[str, list]]:
+    """Fill each category's missing selector kinds from the defaults."""
+    return {category: {**defaults, **selectors} for category, selectors in specific.items()}
+
+
+class CategoryBundle(NamedTuple):
+    """A category's selectors, resolved against the defaults and pre-joined once."""
+    container_joined: str
+    # Tried one at a time; the first selector yielding products wins
+    container_selectors: List[str]
+    general_selectors: List[str]
+    # Plain dict of lists so it can be passed straight to execute_script
+    script_selectors: Dict[str, List[str]]
 
 
 class AltaConfig:
@@ -16,9 +33,16 @@ class AltaConfig:
 
     # Selenium settings
     PAGE_LOAD_TIMEOUT = 45
+    # driver.get returns once the new document is parsed (DOMContentLoaded) rather than
+    # after every image and tracker; scraping then waits for the product containers
+    PAGE_LOAD_STRATEGY = 'eager'
     ELEMENT_TIMEOUT = 15
     DELAY_RANGE = (2, 5)
 
+    # Fewest server-rendered products that make the static (browserless) fetch usable
+    STATIC_MIN_PRODUCTS = 10
+    HTTP_POOL_SIZE = 10
+
     # Enhanced Product selectors - more comprehensive coverage
     # Updated product container selectors
     PRODUCT_SELECTORS = [
@@ -31,26 +55,6 @@ class AltaConfig:
         '.product-card',  # Fallback
     ]
 
-    # Updated name selectors
-    NAME_SELECTORS = [
-        'h2[class*="sc-"][class*="kfQwkI"]',  # Product titles
-        'h1[class*="sc-"][class*="dyUwJu"]',  # Main product names
-        'h2[title]',  # Elements with title attribute
-        'a[title]',  # Links with titles
-        '[class*="sc-28c9b3a8-"] h2',  # Headers in product cards
-        '[class*="sc-bf675a3-"] h1',  # Product detail titles
-    ]
-
-    # Updated price selectors
-    PRICE_SELECTORS = [
-        'span[class*="currency"]',  # Currency spans
-        'span[class*="sc-28c9b3a8-"][class*="jkcOBV"]',  # Price elements
-        'div[class*="sc-88de82a8-"] span',  # Price in product containers
-        '[class*="price"]',  # Generic price classes
-        'span:contains("₾")',  # Georgian Lari symbol
-        'span:contains("ლ")',  # Alternative currency
-    ]
-
     # Updated image selectors
     IMAGE_SELECTORS = [
         'img[class*="sc-28c9b3a8-"]',  # Product images
@@ -127,16 +131,7 @@ class AltaConfig:
         # Cost and amount selectors
         '[class*="cost"]',
         '[class*="amount"]',
-        '[class*="currency"]',
-
-        # Georgian currency specific
-        'span:contains("₾")',
-        'div:contains("₾")',
-        'span:contains("ლ")',
-
-        # Numeric patterns that might be prices
-        'span[class*="sc-"]:contains("₾")',
-        'div[class*="sc-"]:contains("₾")'
+        '[class*="currency"]'
     ]
 
     # Enhanced Link selectors with category-specific patterns
@@ -161,6 +156,11 @@ class AltaConfig:
         'a[href]'
     ]
 
+    DESCRIPTION_SELECTORS = [
+        '.description', '.desc', '.summary',
+        '[class*="description"]', '[class*="desc"]'
+    ]
+
     # Category-specific selectors for better targeting
     CATEGORY_SPECIFIC_SELECTORS = {
         'laptops': {
@@ -225,8 +225,24 @@ class AltaConfig:
         }
     }
 
-    # Brands expanded with more comprehensive list
-    BRANDS = [
+    # Resolved once: every category maps to complete container/name/price selector lists
+    DEFAULT_SELECTORS = {
+        'container': PRODUCT_SELECTORS,
+        'name': NAME_SELECTORS,
+        'price': PRICE_SELECTORS
+    }
+    MERGED_SELECTORS = _merge_selectors(CATEGORY_SPECIFIC_SELECTORS, DEFAULT_SELECTORS)
+
+    # Category-specific product link patterns, tried before LINK_SELECTORS
+    CATEGORY_LINK_PATTERNS = {
+        'laptops': ['a[href*="/laptop/"]', 'a[href*="/notebooks/"]'],
+        'tvs': ['a[href*="/tv/"]', 'a[href*="/television/"]'],
+        'fridges': ['a[href*="/refrigerator/"]', 'a[href*="/fridge/"]'],
+        'phones': ['a[href*="/mobile-phones/"]', 'a[href*="/smartphone/"]']
+    }
+
+    # Brands expanded with more comprehensive list (deduplicated, order kept for matching priority)
+    BRANDS = tuple(dict.fromkeys([
         # Mobile phone brands
         'Apple', 'Samsung', 'Xiaomi', 'Huawei', 'OnePlus', 'Sony', 'LG',
         'Google', 'Motorola', 'Nokia', 'Honor', 'Realme', 'Oppo', 'Vivo',
@@ -246,7 +262,15 @@ class AltaConfig:
         'Samsung', 'LG', 'Bosch', 'Whirlpool', 'Electrolux', 'Indesit',
         'Hotpoint', 'Siemens', 'Miele', 'Candy', 'Beko', 'Zanussi',
         'AEG', 'Haier', 'Liebherr', 'Smeg', 'Gorenje', 'Atlant'
-    ]
+    ]))
+    BRAND_BY_UPPER = {brand.upper(): brand for brand in BRANDS}
+    # One scan per name; longest alternatives first so 'MacBook' wins over shorter prefixes.
+    # Brands must not touch other letters ('MI' in 'PREMIUM'), but may touch digits ('iPhone15').
+    BRANDS_PATTERN = re.compile(
+        r'(?<![^\W\d_])('
+        + '|'.join(re.escape(brand) for brand in sorted(BRAND_BY_UPPER, key=len, reverse=True))
+        + r')(?![^\W\d_])'
+    )
 
     # Chrome options
     CHROME_OPTIONS = [
@@ -258,19 +282,48 @@ class AltaConfig:
         '--disable-extensions',
         '--disable-plugins',
         '--disable-web-security',
-        '--disable-features=VizDisplayCompositor'
+        '--disable-features=VizDisplayCompositor,TranslateUI',
+        '--blink-settings=imagesEnabled=false',
+        '--disable-background-timer-throttling',
+        '--disable-renderer-backgrounding',
+        '--disable-ipc-flooding-protection',
+        '--mute-audio',
+        '--hide-scrollbars'
+    ]
+
+    # Only <img> attributes are read, so image, font and media bytes are never downloaded
+    CHROME_PREFS = {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.managed_default_content_settings.fonts': 2,
+    }
+    BLOCKED_URL_PATTERNS = [
+        '*.png', '*.jpg', '*.jpeg', '*.webp', '*.gif', '*.svg',
+        '*.woff', '*.woff2', '*.ttf', '*.mp4', '*.webm'
     ]
 
     USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
 
     @staticmethod
     def get_category_selectors(category: str) -> Dict[str, list]:
-        """Get category-specific selectors."""
-        return AltaConfig.CATEGORY_SPECIFIC_SELECTORS.get(category, {
-            'container': AltaConfig.PRODUCT_SELECTORS,
-            'name': AltaConfig.NAME_SELECTORS,
-            'price': AltaConfig.PRICE_SELECTORS
-        })
+        """Get category-specific selectors, with defaults for any kind the category lacks."""
+        return AltaConfig.MERGED_SELECTORS.get(category, AltaConfig.DEFAULT_SELECTORS)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_category_bundle(category: str) -> CategoryBundle:
+        """Get a category's selectors resolved once for container lookup and script extraction."""
+        selectors = AltaConfig.get_category_selectors(category)
+        return CategoryBundle(
+            container_joined=', '.join(selectors['container']),
+            container_selectors=list(selectors['container']),
+            general_selectors=list(AltaConfig.PRODUCT_SELECTORS),
+            script_selectors={
+                'name': list(selectors['name']),
+                'price': list(selectors['price']),
+                'link': list(dict.fromkeys(AltaConfig.CATEGORY_LINK_PATTERNS.get(category, []) + AltaConfig.LINK_SELECTORS)),
+                'description': list(AltaConfig.DESCRIPTION_SELECTORS),
+            },
+        )
 
     @staticmethod
     def setup_logging(debug: bool = False) -> logging.Logger:
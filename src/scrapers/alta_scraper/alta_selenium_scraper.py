@@ -3,42 +3,166 @@
 Enhanced scraper class for Alta.ge with category-specific selectors
 """
 
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, WebDriverException, SessionNotCreatedException
+)
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 
 from alta_config import AltaConfig
-from alta_utilities import AltaUtilities
+from alta_utilities import AltaUtilities, PRICE_TEXT_PATTERN, PRODUCT_KEYWORDS
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Browser-side AltaUtilities.is_product_element over the selectors in order: returns the
+# matches of the first selector that yields products, so candidates are filtered without
+# one element.text round-trip each and nested matches of other selectors are not mixed in
+FIND_PRODUCT_ELEMENTS_JS = """
+const [selectors, pricePattern, keywords] = arguments;
+const priceRe = new RegExp(pricePattern);
+const isProduct = (el) => {
+    const text = (el.innerText || '').toLowerCase();
+    const looksLikeProduct = priceRe.test(text) || keywords.some((word) => text.includes(word));
+    return looksLikeProduct && text.trim().length > 10;
+};
+for (const selector of selectors) {
+    let elements;
+    try { elements = document.querySelectorAll(selector); } catch (e) { continue; }
+    const products = Array.from(elements).filter(isProduct);
+    if (products.length) { return products; }
+}
+return [];
+"""
+
+# Mirrors _extract_name/_extract_price/_extract_url/_extract_image and the description and
+# availability lookups in the browser so a product costs one WebDriver round-trip;
+# selectors are tried in order, and invalid ones are skipped like a failed find_element
+EXTRACT_PRODUCT_JS = """
+const [root, sel] = arguments;
+const first = (selector) => { try { return root.querySelector(selector); } catch (e) { return null; } };
+const text = (el) => (el.innerText || '').trim();
+
+let name = null;
+for (const selector of sel.name) {
+    const el = first(selector);
+    const value = el && (text(el) || el.getAttribute('title'));
+    if (value && value.length > 5) { name = value; break; }
+}
+if (!name) {
+    for (const link of root.querySelectorAll('a')) {
+        const title = link.getAttribute('title');
+        const value = text(link);
+        if (title && title.length > 5) { name = title; break; }
+        if (value && value.length > 5) { name = value; break; }
+    }
+}
+
+const priceTexts = [];
+for (const selector of sel.price) {
+    const el = first(selector);
+    if (el && text(el)) { priceTexts.push(text(el)); }
+}
+
+let href = null;
+for (const selector of sel.link) {
+    const el = first(selector);
+    if (el && el.getAttribute('href')) { href = el.href || el.getAttribute('href'); break; }
+}
+
+const img = root.querySelector('img');
+const imgSrc = img ? ((img.getAttribute('src') && img.src) || img.getAttribute('data-src')) : null;
+
+let description = '';
+for (const selector of sel.description) {
+    const el = first(selector);
+    if (el && text(el)) { description = text(el); break; }
+}
+
+const blockTexts = Array.from(root.querySelectorAll('div, span'), text).filter(Boolean);
+
+return {
+    name: name, priceTexts: priceTexts, href: href, imgSrc: imgSrc, fullText: text(root),
+    description: description, blockTexts: blockTexts
+};
+"""
+
+# Resolved chromedriver path, reused by later processes so they skip webdriver_manager's network check
+DRIVER_PATH_CACHE = Path.home() / '.cache' / 'alta_scraper' / 'driver_path'
 
 
 class AltaScraper:
     """Enhanced Selenium-based scraper for alta.ge with category-specific logic."""
 
-    def __init__(self, headless: bool = True, max_products: int = 50, debug: bool = False):
+    _cached_driver_path: Optional[str] = None
+
+    def __init__(self, headless: bool = True, max_products: int = 50, debug: bool = False, driver=None):
         self.max_products = max_products
         self.headless = headless
         self.debug = debug
-        self.driver = None
-        self.wait = None
+        # A driver passed in stays warm across categories and is left for the caller to quit
+        self.driver = driver
+        self.wait = WebDriverWait(driver, AltaConfig.ELEMENT_TIMEOUT) if driver else None
+        self._owns_driver = driver is None
+        self._site_checked = False
+        # Every product saved by this scraper, so callers need not re-read the output files
         self.scraped_data = []
         self.current_category = None
+        self._session = None
 
         self.logger = AltaConfig.setup_logging(debug)
 
+    @classmethod
+    def _resolve_driver_path(cls, refresh: bool = False) -> str:
+        """Return the chromedriver path, installing it when no cached path exists or on refresh."""
+        if refresh:
+            # The cached driver no longer matches the installed Chrome
+            cls._cached_driver_path = None
+            try:
+                DRIVER_PATH_CACHE.unlink()
+            except OSError:
+                pass
+        elif cls._cached_driver_path and Path(cls._cached_driver_path).is_file():
+            return cls._cached_driver_path
+
+        try:
+            cached_path = DRIVER_PATH_CACHE.read_text(encoding='utf-8').strip()
+        except OSError:
+            cached_path = ""
+
+        if not cached_path or not Path(cached_path).is_file():
+            from webdriver_manager.chrome import ChromeDriverManager
+
+            cached_path = ChromeDriverManager().install()
+            try:
+                DRIVER_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+                DRIVER_PATH_CACHE.write_text(cached_path, encoding='utf-8')
+            except OSError:
+                pass
+
+        cls._cached_driver_path = cached_path
+        return cached_path
+
     def setup_driver(self) -> None:
         """Setup Chrome WebDriver."""
         try:
-            service = Service(ChromeDriverManager().install())
             chrome_options = Options()
+            chrome_options.page_load_strategy = AltaConfig.PAGE_LOAD_STRATEGY
 
             if self.headless:
                 chrome_options.add_argument('--headless=new')
@@ -48,10 +172,21 @@ class AltaScraper:
 
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
+            chrome_options.add_experimental_option('prefs', AltaConfig.CHROME_PREFS)
             chrome_options.add_argument(f'--user-agent={AltaConfig.USER_AGENT}')
 
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            try:
+                self.driver = webdriver.Chrome(service=Service(self._resolve_driver_path()), options=chrome_options)
+            except SessionNotCreatedException as e:
+                # Chrome updated since the driver path was cached: fetch a matching driver once
+                self.logger.info(f"Cached chromedriver rejected ({e.msg}), installing a matching one")
+                self.driver = webdriver.Chrome(service=Service(self._resolve_driver_path(refresh=True)), options=chrome_options)
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            try:
+                self.driver.execute_cdp_cmd('Network.enable', {})
+                self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': AltaConfig.BLOCKED_URL_PATTERNS})
+            except Exception as e:
+                self.logger.debug(f"Could not block static resources: {e}")
             self.driver.set_page_load_timeout(AltaConfig.PAGE_LOAD_TIMEOUT)
             self.wait = WebDriverWait(self.driver, AltaConfig.ELEMENT_TIMEOUT)
 
@@ -74,14 +209,19 @@ class AltaScraper:
             self.logger.info(f"Current URL: {current_url}")
             self.logger.info(f"Page title: {page_title}")
 
-            page_source = self.driver.page_source.lower()
+            # Challenge pages show their message in the title or at the top of the body,
+            # so only those are read rather than serializing the whole DOM
+            body_text = self.driver.execute_script(
+                "return document.body ? document.body.innerText.slice(0, 4096) : '';"
+            ) or ''
+            probe_text = f"{page_title}\n{body_text}".lower()
             blocking_indicators = [
                 'cloudflare', 'access denied', 'blocked', 'captcha',
                 'security check', 'please wait', 'checking your browser'
             ]
 
             for indicator in blocking_indicators:
-                if indicator in page_source:
+                if indicator in probe_text:
                     self.logger.warning(f"Possible blocking detected: {indicator}")
                     return False
 
@@ -95,59 +235,199 @@ class AltaScraper:
             self.logger.error(f"Error accessing site: {e}")
             return False
 
-    def find_product_elements(self, category: str):
-        """Find product elements using category-specific selectors."""
-        product_elements = []
+    def _get_session(self) -> requests.Session:
+        """Return the scraper's keep-alive HTTP session, created on first use."""
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers.update({'User-Agent': AltaConfig.USER_AGENT})
+            # Every HTTPS fetch of this scraper reuses the pooled connections and their TLS sessions
+            self._session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=AltaConfig.HTTP_POOL_SIZE))
+        return self._session
+
+    def _try_static_fetch(self, category_url: str, category: str) -> List[Dict[str, Any]]:
+        """Scrape server-rendered product tiles without a browser; empty when too few are found."""
+        try:
+            response = self._get_session().get(category_url, timeout=AltaConfig.ELEMENT_TIMEOUT)
+            response.raise_for_status()
+            soup = BeautifulSoup(response.text, HTML_PARSER)
+        except Exception as e:
+            self.logger.debug(f"Static fetch failed for {category}: {e}")
+            return []
 
-        # Get category-specific selectors first
-        category_selectors = AltaConfig.get_category_selectors(category)
-        container_selectors = category_selectors.get('container', AltaConfig.PRODUCT_SELECTORS)
+        bundle = AltaConfig.get_category_bundle(category)
+        tiles = (self._first_static_tiles(soup, bundle.container_selectors)
+                 or self._first_static_tiles(soup, bundle.general_selectors))
 
-        # Try category-specific selectors first
-        for selector in container_selectors:
+        products = []
+        seen_urls = set()
+        for tile in tiles:
+            if len(products) >= self.max_products:
+                break
+            product_data = self._product_from_scraped(self._extract_all_static(tile, bundle.script_selectors))
+            if product_data and self._is_new_product(product_data, seen_urls):
+                products.append(self._tag_product(product_data, category))
+
+        if len(products) < min(self.max_products, AltaConfig.STATIC_MIN_PRODUCTS):
+            self.logger.info(f"Static HTML yielded {len(products)} {category} products, using the browser")
+            return []
+        return products
+
+    def _first_static_tiles(self, soup, selectors: List[str]) -> List[Any]:
+        """Product tiles of the first selector that matches any, like _find_filtered_elements."""
+        for selector in selectors:
             try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    self.logger.info(f"Found {len(elements)} elements with category selector: {selector}")
-                    filtered_elements = [e for e in elements if AltaUtilities.is_product_element(e)]
-
-                    if filtered_elements:
-                        self.logger.info(f"Filtered to {len(filtered_elements)} actual product elements")
-                        product_elements = filtered_elements
-                        break
+                tiles = [tile for tile in soup.select(selector) if self._is_static_product(tile)]
             except Exception as e:
-                self.logger.debug(f"Error with category selector {selector}: {e}")
+                self.logger.debug(f"Error with static selector {selector}: {e}")
                 continue
+            if tiles:
+                return tiles
+        return []
+
+    @staticmethod
+    def _is_new_product(product_data: Dict[str, Any], seen_urls: set) -> bool:
+        """False for a product whose URL was already scraped; records the URL otherwise."""
+        product_url = product_data.get('product_url')
+        if product_url in seen_urls:
+            return False
+        if product_url:
+            seen_urls.add(product_url)
+        return True
+
+    @staticmethod
+    def _is_static_product(tile) -> bool:
+        """AltaUtilities.is_product_element for a parsed HTML tag."""
+        text_content = tile.get_text(' ', strip=True).lower()
+        has_price = PRICE_TEXT_PATTERN.search(text_content) is not None
+        has_product_content = any(word in text_content for word in PRODUCT_KEYWORDS)
+        return (has_price or has_product_content) and len(text_content) > 10
+
+    @staticmethod
+    def _extract_all_static(tile, selectors: Dict[str, List[str]]) -> Dict[str, Any]:
+        """EXTRACT_PRODUCT_JS for a parsed HTML tag, returning the same fields."""
+        def first(selector: str):
+            try:
+                return tile.select_one(selector)
+            except Exception:
+                return None
+
+        def text(tag) -> str:
+            return tag.get_text(' ', strip=True)
+
+        name = None
+        for selector in selectors['name']:
+            tag = first(selector)
+            value = tag is not None and (text(tag) or tag.get('title'))
+            if value and len(value) > 5:
+                name = value
+                break
+        if not name:
+            for link in tile.find_all('a'):
+                title = link.get('title')
+                value = text(link)
+                if title and len(title) > 5:
+                    name = title
+                    break
+                if value and len(value) > 5:
+                    name = value
+                    break
+
+        price_texts = []
+        for selector in selectors['price']:
+            tag = first(selector)
+            if tag is not None and text(tag):
+                price_texts.append(text(tag))
+
+        href = None
+        for selector in selectors['link']:
+            tag = first(selector)
+            if tag is not None and tag.get('href'):
+                href = tag.get('href')
+                break
+
+        img = tile.find('img')
+        description = ""
+        for selector in selectors['description']:
+            tag = first(selector)
+            if tag is not None and text(tag):
+                description = text(tag)
+                break
+
+        return {
+            'name': name,
+            'priceTexts': price_texts,
+            'href': href,
+            'imgSrc': (img.get('src') or img.get('data-src')) if img is not None else None,
+            'fullText': text(tile),
+            'description': description,
+            'blockTexts': [value for value in (text(tag) for tag in tile.find_all(['div', 'span'])) if value],
+        }
+
+    @staticmethod
+    def _tag_product(product_data: Dict[str, Any], category: str) -> Dict[str, Any]:
+        """Stamp a product record with its source, category and scrape time."""
+        product_data.update({
+            'source': 'alta.ge',
+            'category': category,
+            'createdat': datetime.now(timezone.utc).isoformat()
+        })
+        return product_data
+
+    def find_product_elements(self, category: str):
+        """Find product elements using category-specific selectors."""
+        # Get category-specific selectors first
+        bundle = AltaConfig.get_category_bundle(category)
+
+        # Try category-specific selectors first
+        product_elements = self._find_filtered_elements(bundle.container_selectors, "category")
 
         # Fall back to general selectors if category-specific didn't work
         if not product_elements:
             self.logger.info("Falling back to general selectors...")
-            for selector in AltaConfig.PRODUCT_SELECTORS:
+            product_elements = self._find_filtered_elements(bundle.general_selectors, "general")
+
+        return product_elements
+
+    def _find_filtered_elements(self, selectors: List[str], kind: str) -> List[Any]:
+        """Return the likely product elements of the first selector that has any."""
+        # Trying the selectors and filtering in the browser is a single WebDriver round-trip
+        try:
+            filtered_elements = self.driver.execute_script(
+                FIND_PRODUCT_ELEMENTS_JS, list(selectors), PRICE_TEXT_PATTERN.pattern, list(PRODUCT_KEYWORDS)
+            ) or []
+        except Exception as e:
+            self.logger.debug(f"Script filtering failed for {kind} selectors, filtering per element: {e}")
+            filtered_elements = []
+            for selector in selectors:
                 try:
                     elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        self.logger.info(f"Found {len(elements)} elements with general selector: {selector}")
-                        filtered_elements = [e for e in elements if AltaUtilities.is_product_element(e)]
-
-                        if filtered_elements:
-                            self.logger.info(f"Filtered to {len(filtered_elements)} actual product elements")
-                            product_elements = filtered_elements
-                            break
                 except Exception as e:
-                    self.logger.debug(f"Error with general selector {selector}: {e}")
+                    self.logger.debug(f"Error with {kind} selector {selector}: {e}")
                     continue
+                filtered_elements = [e for e in elements if AltaUtilities.is_product_element(e)]
+                if filtered_elements:
+                    self.logger.info(f"Found {len(elements)} elements with {kind} selector: {selector}")
+                    break
 
-        return product_elements
+        if filtered_elements:
+            self.logger.info(f"Filtered to {len(filtered_elements)} actual product elements")
+        return filtered_elements
 
     def extract_product_info(self, element, category: str) -> Optional[Dict[str, Any]]:
         """Extract product information from element using category-specific selectors."""
         try:
+            # Name, price, URL, image and availability texts in one round-trip
+            scraped = self._extract_all_js(element, category)
+            if scraped is not None:
+                return self._product_from_scraped(scraped)
+
+            # Per-field lookups only if the script fails
             product_data = {}
 
-            # Get category-specific selectors
-            category_selectors = AltaConfig.get_category_selectors(category)
-            name_selectors = category_selectors.get('name', AltaConfig.NAME_SELECTORS)
-            price_selectors = category_selectors.get('price', AltaConfig.PRICE_SELECTORS)
+            # Get category-specific selectors, already resolved against the defaults
+            selectors = AltaConfig.get_category_bundle(category).script_selectors
+            name_selectors = selectors['name']
+            price_selectors = selectors['price']
 
             # Extract name using category-specific selectors first
             product_name = self._extract_name(element, name_selectors)
@@ -157,14 +437,11 @@ class AltaScraper:
             product_data['name'] = product_name
 
             # Extract price using category-specific selectors
-            price = self._extract_price(element, price_selectors)
-            product_data['price'] = price
+            product_data['price'] = self._extract_price(element, price_selectors)
             product_data['brand'] = AltaUtilities.extract_brand_from_name(product_name)
 
-            # Extract URL
+            # Extract URL and image
             product_data['product_url'] = self._extract_url(element, category)
-
-            # Extract image
             product_data['image_url'] = self._extract_image(element)
 
             # Extract additional info
@@ -174,33 +451,78 @@ class AltaScraper:
             return product_data
 
         except Exception as e:
-            self.logger.debug(f"Error extracting product info: {e}")
+            self.logger.debug("Error extracting product info: %s", e)
             return None
 
+    def _product_from_scraped(self, scraped: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Build a product record from the raw fields of the browser or static extraction."""
+        product_name = scraped.get('name')
+        if not product_name:
+            return None
+
+        return {
+            'name': product_name,
+            'price': self._price_from_texts(scraped.get('priceTexts') or [], scraped.get('fullText') or ''),
+            'brand': AltaUtilities.extract_brand_from_name(product_name),
+            'product_url': self._absolute_url(scraped.get('href')),
+            'image_url': self._absolute_url(scraped.get('imgSrc')),
+            'description': scraped.get('description') or "",
+            'availability': AltaUtilities.availability_from_texts(scraped.get('blockTexts') or []),
+        }
+
+    def _extract_all_js(self, element, category: str) -> Optional[Dict[str, Any]]:
+        """Extract name, price texts, URL, image, description and availability texts in one script call."""
+        selectors = AltaConfig.get_category_bundle(category).script_selectors
+        try:
+            return self.driver.execute_script(EXTRACT_PRODUCT_JS, element, selectors)
+        except Exception as e:
+            self.logger.debug("Script extraction failed, using per-field lookups: %s", e)
+            return None
+
+    @staticmethod
+    def _price_from_texts(price_texts: List[str], full_text: str) -> Optional[float]:
+        """Return the first price found in the selector texts, else in the element's full text."""
+        for price_text in price_texts:
+            extracted_price = AltaUtilities.extract_price(price_text)
+            if extracted_price:
+                return extracted_price
+        return AltaUtilities.extract_price(full_text)
+
+    @staticmethod
+    def _absolute_url(url: Optional[str]) -> Optional[str]:
+        """Prefix site-relative URLs with the Alta base URL."""
+        if url and not url.startswith('http'):
+            return f"{AltaConfig.BASE_URL}{url}"
+        return url
+
+    @staticmethod
+    def _first_element(element, selector: str):
+        """Return the first match of a CSS selector under element, or None without raising on a miss."""
+        try:
+            matches = element.find_elements(By.CSS_SELECTOR, selector)
+        except WebDriverException:
+            return None
+        return matches[0] if matches else None
+
     def _extract_name(self, element, name_selectors: List[str]) -> Optional[str]:
         """Extract product name using provided selectors."""
         # Try category-specific selectors first
         for selector in name_selectors:
-            try:
-                name_element = element.find_element(By.CSS_SELECTOR, selector)
-                text = name_element.text.strip() or name_element.get_attribute('title')
-                if text and len(text) > 5:
-                    return text
-            except:
+            name_element = self._first_element(element, selector)
+            if name_element is None:
                 continue
+            text = name_element.text.strip() or name_element.get_attribute('title')
+            if text and len(text) > 5:
+                return text
 
         # Fallback to general name extraction
-        try:
-            links = element.find_elements(By.TAG_NAME, "a")
-            for link in links:
-                title = link.get_attribute('title')
-                text = link.text.strip()
-                if title and len(title) > 5:
-                    return title
-                elif text and len(text) > 5:
-                    return text
-        except:
-            pass
+        for link in element.find_elements(By.TAG_NAME, "a"):
+            title = link.get_attribute('title')
+            text = link.text.strip()
+            if title and len(title) > 5:
+                return title
+            elif text and len(text) > 5:
+                return text
 
         return None
 
@@ -208,69 +530,38 @@ class AltaScraper:
         """Extract price using provided selectors."""
         # Try category-specific price selectors first
         for selector in price_selectors:
-            try:
-                price_element = element.find_element(By.CSS_SELECTOR, selector)
-                price_text = price_element.text.strip()
-                if price_text:
-                    extracted_price = AltaUtilities.extract_price(price_text)
-                    if extracted_price:
-                        return extracted_price
-            except:
+            price_element = self._first_element(element, selector)
+            if price_element is None:
                 continue
+            price_text = price_element.text.strip()
+            if price_text:
+                extracted_price = AltaUtilities.extract_price(price_text)
+                if extracted_price:
+                    return extracted_price
 
         # Fallback to extracting from entire element text
         return AltaUtilities.extract_price(element.text)
 
     def _extract_url(self, element, category: str) -> Optional[str]:
         """Extract product URL."""
-        try:
-            # Try category-specific link patterns first
-            category_patterns = {
-                'laptops': ['a[href*="/laptop/"]', 'a[href*="/notebooks/"]'],
-                'tvs': ['a[href*="/tv/"]', 'a[href*="/television/"]'],
-                'fridges': ['a[href*="/refrigerator/"]', 'a[href*="/fridge/"]'],
-                'phones': ['a[href*="/mobile-phones/"]', 'a[href*="/smartphone/"]']
-            }
-
-            patterns = category_patterns.get(category, [])
-            for pattern in patterns:
-                try:
-                    link_element = element.find_element(By.CSS_SELECTOR, pattern)
-                    href = link_element.get_attribute('href')
-                    if href:
-                        if not href.startswith('http'):
-                            href = f"{AltaConfig.BASE_URL}{href}"
-                        return href
-                except:
-                    continue
-
-            # Fall back to general link selectors
-            for selector in AltaConfig.LINK_SELECTORS:
-                try:
-                    link_element = element.find_element(By.CSS_SELECTOR, selector)
-                    href = link_element.get_attribute('href')
-                    if href:
-                        if not href.startswith('http'):
-                            href = f"{AltaConfig.BASE_URL}{href}"
-                        return href
-                except:
-                    continue
-
-        except Exception as e:
-            self.logger.debug(f"Error extracting URL: {e}")
+        # Category-specific link patterns first, then the general link selectors
+        for selector in AltaConfig.get_category_bundle(category).script_selectors['link']:
+            link_element = self._first_element(element, selector)
+            if link_element is None:
+                continue
+            href = link_element.get_attribute('href')
+            if href:
+                return self._absolute_url(href)
 
         return None
 
     def _extract_image(self, element) -> Optional[str]:
         """Extract product image URL."""
-        try:
-            img_element = element.find_element(By.TAG_NAME, "img")
-            img_src = img_element.get_attribute('src') or img_element.get_attribute('data-src')
-            if img_src and not img_src.startswith('http'):
-                img_src = f"{AltaConfig.BASE_URL}{img_src}"
-            return img_src
-        except:
+        img_element = self._first_element(element, "img")
+        if img_element is None:
             return None
+        img_src = img_element.get_attribute('src') or img_element.get_attribute('data-src')
+        return self._absolute_url(img_src)
 
     def scrape_products(self, category_url: str, category: str) -> List[Dict[str, Any]]:
         """Scrape products from category page."""
@@ -280,13 +571,13 @@ class AltaScraper:
         try:
             self.logger.info(f"Loading {category} category page: {category_url}")
             self.driver.get(category_url)
-            time.sleep(5)
 
+            # Proceed as soon as the first product container renders instead of sleeping blind
+            container_selector = AltaConfig.get_category_bundle(category).container_joined
             try:
-                self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                time.sleep(3)
+                self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, container_selector)))
             except TimeoutException:
-                self.logger.warning("Timeout waiting for page body")
+                self.logger.warning(f"Timeout waiting for {category} product containers")
 
             # Use category-specific element finding
             product_elements = self.find_product_elements(category)
@@ -297,6 +588,7 @@ class AltaScraper:
 
             self.logger.info(f"Processing {len(product_elements)} product elements for {category}...")
 
+            seen_urls = set()
             for i, element in enumerate(product_elements):
                 if len(products) >= self.max_products:
                     break
@@ -305,19 +597,12 @@ class AltaScraper:
                     # Use category-specific extraction
                     product_data = self.extract_product_info(element, category)
 
-                    if product_data and product_data.get('name'):
-                        product_data.update({
-                            'source': 'alta.ge',
-                            'category': category,
-                            'createdat': datetime.now(timezone.utc).isoformat()
-                        })
-
-                        products.append(product_data)
+                    if product_data and product_data.get('name') and self._is_new_product(product_data, seen_urls):
+                        products.append(self._tag_product(product_data, category))
                         self.logger.info(f"[{len(products)}] {product_data['name'][:60]}...")
-                        time.sleep(0.5)
 
                 except Exception as e:
-                    self.logger.debug(f"Error processing element {i}: {e}")
+                    self.logger.debug("Error processing element %d: %s", i, e)
                     continue
 
         except Exception as e:
@@ -328,13 +613,32 @@ class AltaScraper:
     def run(self, category: str) -> str:
         """Main scraping method."""
         try:
-            self.logger.info(f"🚀 Starting Enhanced Alta.ge scraper for category: {category}")
-
-            self.setup_driver()
+            return self._run_category(category)
+        finally:
+            self.close()
 
-            if not self.test_site_accessibility():
-                self.logger.error("Site is not accessible")
-                return ""
+    def run_categories(self, categories: List[str]) -> Dict[str, str]:
+        """Scrape categories one after another, reusing one warm browser for all of them."""
+        try:
+            return {category: self._run_category(category) for category in categories}
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Release the HTTP session, and the WebDriver when this scraper started it."""
+        if self._session:
+            self._session.close()
+            self._session = None
+        if self.driver and self._owns_driver:
+            self.driver.quit()
+            self.driver = None
+            self._site_checked = False
+            self.logger.info("WebDriver closed")
+
+    def _run_category(self, category: str) -> str:
+        """Scrape and save one category, starting the browser only on first need."""
+        try:
+            self.logger.info(f"🚀 Starting Enhanced Alta.ge scraper for category: {category}")
 
             category_path = AltaConfig.CATEGORY_URLS.get(category)
             if not category_path:
@@ -342,13 +646,30 @@ class AltaScraper:
                 return ""
 
             category_url = f"{AltaConfig.BASE_URL}{category_path}"
-            products = self.scrape_products(category_url, category)
+
+            # Server-rendered tiles need no browser; Selenium only when the static HTML falls short
+            products = self._try_static_fetch(category_url, category)
+            if products:
+                self.current_category = category
+            else:
+                if self.driver is None:
+                    self.setup_driver()
+
+                if not self._site_checked:
+                    if not self.test_site_accessibility():
+                        self.logger.error("Site is not accessible")
+                        return ""
+                    self._site_checked = True
+
+                products = self.scrape_products(category_url, category)
 
             if not products:
                 self.logger.warning(f"No products were scraped from {category}")
                 return ""
 
-            filepath = AltaUtilities.save_data(products, category)
+            filepath = AltaUtilities.save_data(products, category, indent=self.debug)
+            if filepath:
+                self.scraped_data.extend(products)
             self.logger.info(f"🎉 Successfully scraped {len(products)} products from {category}")
             return filepath
 
@@ -356,7 +677,22 @@ class AltaScraper:
             self.logger.error(f"💥 Scraping failed with error: {e}")
             return ""
 
-        finally:
-            if self.driver:
-                self.driver.quit()
-                self.logger.info("WebDriver closed")
\ No newline at end of file
+    @classmethod
+    def run_all(cls, categories: List[str], workers: int = 4, headless: bool = True,
+                max_products: int = 50, debug: bool = False) -> Dict[str, str]:
+        """Scrape several categories concurrently; each worker keeps one warm browser for its share."""
+        categories = list(dict.fromkeys(categories))
+        worker_count = max(1, min(workers, len(categories)))
+        groups = [categories[i::worker_count] for i in range(worker_count)]
+        # Built up front: setup_logging resets the shared logger's handlers
+        scrapers = [cls(headless=headless, max_products=max_products, debug=debug) for _ in groups]
+
+        # One worker needs no pool: scrape in the calling thread
+        if worker_count == 1:
+            return scrapers[0].run_categories(categories)
+
+        results: Dict[str, str] = {}
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            for group_results in executor.map(lambda pair: pair[0].run_categories(pair[1]), zip(scrapers, groups)):
+                results.update(group_results)
+        return {category: results[category] for category in categories}
\ No newline at end of file
@@ -7,10 +7,45 @@ import json
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
 from selenium.webdriver.common.by import By
 from alta_config import AltaConfig
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Currency symbols and the letters of GEL/USD/EUR/лари/руб in either case, deleted in one translate pass
+CURRENCY_CHARS = '₾$€£¥лари|GELUSDEURрубლ'
+CURRENCY_STRIP_TABLE = str.maketrans('', '', ''.join(sorted(set(
+    CURRENCY_CHARS + CURRENCY_CHARS.lower() + CURRENCY_CHARS.upper()
+))))
+PRICE_WORDS_PATTERN = re.compile(r'\b(price|cost|from|starting|lari|ფასი)\b', re.IGNORECASE)
+NUMBER_PATTERN = re.compile(r'\d+[.,]?\d*')
+# A number followed by a currency marker, as one alternation so each element text is scanned once
+PRICE_TEXT_PATTERN = re.compile(r'\d+[.,]?\d*\s*(?:[₾lariლ]|gel)')
+SKIP_WORDS = frozenset({'new', 'used', 'original', 'refurbished', 'the', 'a', 'ახალი', 'ნაცნობი'})
+AVAILABLE_KEYWORDS = ('in stock', 'available', 'available in stores', 'მარაგშია', 'მიწოდება')
+OUT_OF_STOCK_KEYWORDS = ('out of stock', 'unavailable', 'არ არის')
+# Single-call reads used by the WebDriver helpers below instead of one .text round-trip per child
+FIRST_TEXT_JS = """
+const [root, selectors] = arguments;
+for (const selector of selectors) {
+    let el = null;
+    try { el = root.querySelector(selector); } catch (e) { continue; }
+    const value = el ? (el.innerText || '').trim() : '';
+    if (value) { return value; }
+}
+return '';
+"""
+BLOCK_TEXTS_JS = "return Array.from(arguments[0].querySelectorAll('div, span'), (el) => el.innerText || '');"
+PRODUCT_KEYWORDS = (
+    'samsung', 'apple', 'iphone', 'galaxy', 'buy', 'ყიდვა',
+    'laptop', 'computer', 'tv', 'телевизор', 'холодильник'
+)
+
 
 class AltaUtilities:
     """Utility functions for data extraction and processing."""
@@ -21,10 +56,10 @@ class AltaUtilities:
         if not price_text:
             return None
 
-        price_clean = re.sub(r'[₾$€£¥лари|GEL|USD|EUR|руб|ლ]', '', price_text, flags=re.IGNORECASE)
-        price_clean = re.sub(r'\b(price|cost|from|starting|lari|ფასი)\b', '', price_clean, flags=re.IGNORECASE)
+        price_clean = price_text.translate(CURRENCY_STRIP_TABLE)
+        price_clean = PRICE_WORDS_PATTERN.sub('', price_clean)
 
-        numbers = re.findall(r'\d+[.,]?\d*', price_clean)
+        numbers = NUMBER_PATTERN.findall(price_clean)
         if not numbers:
             return None
 
@@ -50,17 +85,15 @@ class AltaUtilities:
         if not product_name:
             return "Unknown"
 
-        product_upper = product_name.upper()
-
-        for brand in AltaConfig.BRANDS:
-            if brand.upper() in product_upper:
-                return brand
+        match = AltaConfig.BRANDS_PATTERN.search(product_name.upper())
+        if match:
+            return AltaConfig.BRAND_BY_UPPER[match.group(1)]
 
-        words = product_name.split()
+        # Only the first word is needed, so stop splitting after it
+        words = product_name.split(None, 1)
         if words:
             first_word = words[0]
-            skip_words = ['new', 'used', 'original', 'refurbished', 'the', 'a', 'ახალი', 'ნაცნობი']
-            if first_word.lower() not in skip_words and len(first_word) > 2:
+            if first_word.lower() not in SKIP_WORDS and len(first_word) > 2:
                 return first_word
 
         return "Unknown"
@@ -71,22 +104,9 @@ class AltaUtilities:
         try:
             text_content = element.text.lower()
 
-            price_patterns = [
-                r'\d+[.,]?\d*\s*[₾lari]',
-                r'\d+[.,]?\d*\s*[₾]',
-                r'\d+[.,]?\d*\s*gel',
-                r'\d+[.,]?\d*\s*ლ',
-            ]
+            has_price = PRICE_TEXT_PATTERN.search(text_content) is not None
 
-            has_price = any(re.search(pattern, text_content) for pattern in price_patterns)
-
-            has_product_content = any(word in text_content for word in [
-                'samsung', 'apple', 'iphone', 'galaxy', 'buy', 'ყიდვა',
-                'laptop', 'computer', 'tv', 'телевизор', 'холодильник'
-            ])
-
-            images = element.find_elements(By.TAG_NAME, "img")
-            has_image = len(images) > 0
+            has_product_content = any(word in text_content for word in PRODUCT_KEYWORDS)
             has_content = len(text_content.strip()) > 10
 
             return (has_price or has_product_content) and has_content
@@ -98,12 +118,12 @@ class AltaUtilities:
     def extract_description(element) -> str:
         """Extract product description."""
         try:
-            desc_selectors = [
-                '.description', '.desc', '.summary',
-                '[class*="description"]', '[class*="desc"]'
-            ]
+            return element.parent.execute_script(FIRST_TEXT_JS, element, AltaConfig.DESCRIPTION_SELECTORS) or ""
+        except Exception:
+            pass
 
-            for selector in desc_selectors:
+        try:
+            for selector in AltaConfig.DESCRIPTION_SELECTORS:
                 try:
                     desc_element = element.find_element(By.CSS_SELECTOR, selector)
                     description = desc_element.text.strip()
@@ -121,30 +141,34 @@ class AltaUtilities:
         """Extract product availability based on keywords in child elements."""
         try:
             # Collect visible text from common containers
-            possible_elements = element.find_elements(By.CSS_SELECTOR, 'div, span')
+            return AltaUtilities.availability_from_texts(element.parent.execute_script(BLOCK_TEXTS_JS, element))
+        except Exception:
+            pass
 
-            for el in possible_elements:
-                try:
-                    text = el.text.strip().lower()
-                    if not text:
-                        continue
+        try:
+            possible_elements = element.find_elements(By.CSS_SELECTOR, 'div, span')
+            return AltaUtilities.availability_from_texts(el.text for el in possible_elements)
+        except Exception:
+            return "Unknown"
 
-                    if any(keyword in text for keyword in
-                           ['in stock', 'available', 'available in stores', 'მარაგშია', 'მიწოდება']):
-                        return "Available"
-                    elif any(keyword in text for keyword in ['out of stock', 'unavailable', 'არ არის']):
-                        return "Out of Stock"
+    @staticmethod
+    def availability_from_texts(texts: Iterable[str]) -> str:
+        """Classify availability from the first child text that mentions a stock keyword."""
+        for text in texts:
+            text = text.strip().lower()
+            if not text:
+                continue
 
-                except Exception:
-                    continue
+            if any(keyword in text for keyword in AVAILABLE_KEYWORDS):
+                return "Available"
+            elif any(keyword in text for keyword in OUT_OF_STOCK_KEYWORDS):
+                return "Out of Stock"
 
-            return "Unknown"
-        except Exception:
-            return "Unknown"
+        return "Unknown"
 
     @staticmethod
-    def save_data(products: List[Dict[str, Any]], category: str) -> str:
-        """Save scraped data to JSON file."""
+    def save_data(products: List[Dict[str, Any]], category: str, indent: bool = False) -> str:
+        """Save scraped data to JSON file, indented only when requested."""
         if not products:
             return ""
 
@@ -156,8 +180,12 @@ class AltaUtilities:
             filename = f"alta_{category}_{len(products)}.json"
             filepath = output_dir / filename
 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(products, f, ensure_ascii=False, indent=2, default=str)
+            if HAS_ORJSON:
+                option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+                filepath.write_bytes(orjson.dumps(products, option=option, default=str))
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(products, f, ensure_ascii=False, indent=2 if indent else None, default=str)
 
             return str(filepath)
 
@@ -17,6 +17,15 @@ All settings can be modified here to adapt the scraper to different
 website structures or requirements.
 """
 
+import soupsieve
+
+# lxml builds BeautifulSoup trees several times faster than the stdlib parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 # Base URL for the EE mobile phones page
 BASE_URL = "https://beta.ee.ge/en/mobiluri-telefonebi-da-aqsesuarebi-c320s"
 
@@ -25,6 +34,12 @@ DEFAULT_MAX_PRODUCTS = 0  # scrape all products
 DEFAULT_SLEEP_DELAY = 1.0  
 DEFAULT_OUTPUT_DIR = "output"
 
+# Concurrent listing-page downloads (aiohttp); also caps open connections to the host
+DEFAULT_MAX_CONCURRENCY = 8
+REQUEST_TIMEOUT = 20  # seconds per request, including the body
+CONNECT_TIMEOUT = 5
+DNS_CACHE_TTL = 300
+
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
@@ -49,16 +64,52 @@ SELECTORS = {
     # Price
     "price": "span.sc-3ff391e0-7, span.frTCbv",
     
+    # Listing-page tiles use a different link/price class than the product_* ones
+    "listing_link": "a.sc-3ff391e0-3, a.iwNALa",
+    "listing_price": "span.sc-3ff391e0-6, span.iwNALa",
+    
     # Stock status
     "stock_status": "span.sc-3ff391e0-10, span.gQmggs",
     
     # Fallback selectors
     "fallback_name": "h3, h2, .product-title, .title",
     "fallback_link": "a[href]",
-    "fallback_price": "[class*='price'], .price, span:contains('₾')",
+    "fallback_price": "[class*='price'], .price, span:-soup-contains('₾')",
     "fallback_container": "div[class*='product'], article, .product-item, .item",
+    
+    # Container ranking hints and the price check for rejected listing divs
+    "price_hint": "span:-soup-contains('₾'), [class*='price']",
+    "product_link_hint": "a[href*='/mobile-phone'], a[href*='/en/']",
+    "rejected_price": "[class*='price'], [class*='cost'], span:-soup-contains('₾')",
+    
+    # Pagination
+    "pagination_link": "a.sc-65de7bd2-2[href*='page=']",
+    "pagination_fallback": "a[href*='page='], .pagination a, nav a, [class*='page'] a",
+    "listing_product": "div[class*='product'], article, .product-item",
+    
+    # Product detail page
+    "detail_sku": "span.sc-235e453a-19.eOnNNp",
+    "detail_specs": "li.sc-235e453a-27.khePzm",
+    "detail_warranty": "div.sc-235e453a-24.hVytZX a",
+    "detail_spec_table": "table.sc-bc705976-4.bbQIJZ",
+    "detail_spec_row": "tr.sc-bc705976-6.UicTo",
+    "detail_spec_cell": "td.sc-bc705976-7",
 }
 
+# Parsed once at import; call sites use COMPILED_SELECTORS[key].select(tag) / .select_one(tag)
+COMPILED_SELECTORS = {key: soupsieve.compile(selector) for key, selector in SELECTORS.items()}
+
+# Price fallbacks tried in order on a listing div; the first hit showing '₾' wins
+PRICE_FALLBACK_SELECTORS = (
+    "span[class*='price']",
+    "div[class*='price']",
+    "span:-soup-contains('₾')",
+    "[class*='cost']",
+    "span",
+    "div",
+)
+COMPILED_PRICE_FALLBACKS = tuple(soupsieve.compile(selector) for selector in PRICE_FALLBACK_SELECTORS)
+
 
 LOGGING_CONFIG = {
     "level": "INFO",
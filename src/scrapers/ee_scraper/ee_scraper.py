@@ -10,21 +10,44 @@ Classes:
 
 Dependencies:
     - requests: For HTTP requests
+    - aiohttp/asyncio: For concurrent listing page downloads
     - BeautifulSoup: For HTML parsing
     - datetime: For timestamp generation
-    - re: For regular expressions
     - os: For file system operations
     - time: For rate limiting
 """
 
+import asyncio
+import aiohttp
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from src.utils.logger import get_logger
 from src.utils.data_helpers import Product, save_products_to_json, extract_brand_from_name, clean_price
+from src.scrapers.ee_scraper.config import (
+    COMPILED_SELECTORS, COMPILED_PRICE_FALLBACKS, DEFAULT_MAX_CONCURRENCY, REQUEST_TIMEOUT, CONNECT_TIMEOUT, DNS_CACHE_TTL,
+    HTML_PARSER
+)
 import time
-import re
 import os
 from datetime import datetime
+from urllib.parse import urlparse
+
+
+class _PriceCharTable(dict):
+    """str.translate table keeping decimal digits and '.', like re.sub(r'[^\\d.]', '', text)."""
+
+    def __missing__(self, codepoint):
+        kept = codepoint if codepoint == 46 or chr(codepoint).isdecimal() else None
+        self[codepoint] = kept
+        return kept
+
+
+PRICE_CHAR_TABLE = _PriceCharTable()
+# Accepted listing link paths and the category each implies, checked in this order
+LINK_PATH_CATEGORIES = (("/cable", "accessories"), ("/accessory", "accessories"), ("/mobile-phone", "phones"))
+# Currency sign and separators dropped from listing prices in one translate pass
+LISTING_PRICE_STRIP_TABLE = str.maketrans('', '', '₾ ,')
 
 
 class EEScraper:
@@ -40,12 +63,13 @@ class EEScraper:
         logger: Logger instance for debugging and monitoring
         max_products (int): Maximum number of products to scrape (0 for unlimited)
         sleep (float): Delay between requests in seconds
+        max_concurrency (int): Maximum number of listing pages downloaded at once
         headers (dict): HTTP headers for requests
     """
     
     BASE_URL = "https://beta.ee.ge/en/mobiluri-telefonebi-da-aqsesuarebi-c320s"
 
-    def __init__(self, max_products=10, sleep=1.0):
+    def __init__(self, max_products=10, sleep=1.0, max_concurrency=DEFAULT_MAX_CONCURRENCY):
         """
         Initialize the EE scraper with configuration parameters.
         
@@ -53,14 +77,39 @@ class EEScraper:
             max_products (int): Maximum number of products to scrape. 
                               Default is 100. Use 0 for unlimited scraping.
             sleep (float): Delay between requests in seconds. Default is 1.0.
+            max_concurrency (int): Maximum number of listing pages downloaded at once.
         """
         self.logger = get_logger(__name__)
         self.max_products = max_products
         self.sleep = sleep
+        self.max_concurrency = max(1, max_concurrency)
+        # Earliest monotonic time the next request to each host may start
+        self._next_request_at = {}
+        # Parsed detail pages by URL; listings often link the same product more than once
+        self._details_cache = {}
+        self._session = None
+        # Listing page bodies already downloaded by get_all_listing_pages, reused by run()
+        self._prefetched_pages = {}
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
 
+    def _get_session(self):
+        """
+        Return the scraper's keep-alive HTTP session, creating it on first use.
+        
+        Synchronous requests share its pooled connections, so only the first request
+        to beta.ee.ge pays for the TCP and TLS handshake.
+        
+        Returns:
+            requests.Session: Session sending the scraper's headers
+        """
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers.update(self.headers)
+            self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency))
+        return self._session
+
     def clean_price_to_number(self, price_text):
         """
         Convert price text to numeric value by removing currency symbols and formatting.
@@ -74,29 +123,42 @@ class EEScraper:
         if not price_text or price_text == "N/A":
             return 0
         
-        cleaned = price_text.replace('₾', '').replace(' ', '').strip()
-        cleaned = re.sub(r'[^\d.]', '', cleaned)
+        cleaned = price_text.translate(PRICE_CHAR_TABLE)
         
         try:
             return int(float(cleaned))
         except (ValueError, TypeError):
             return 0
 
+    @staticmethod
+    def _page_number(url):
+        """Return the page query parameter of a listing URL, or 0 if it has none."""
+        _, found, rest = url.partition("page=")
+        if not found:
+            return 0
+        try:
+            return int(rest.split("&", 1)[0])
+        except ValueError:
+            return 0
+
     def get_all_listing_pages(self):
         """
         Fetch all page URLs from pagination using the EE site structure.
         
         This method analyzes the main page to find pagination links and generates
         a comprehensive list of all available product listing pages. It includes
-        fallback mechanisms for different pagination structures.
+        fallback mechanisms for different pagination structures. Each page number is
+        kept once, with the base URL standing in for page 0, and pages the pagination
+        widget elides are filled in up to the highest page it links to.
         
         Returns:
             list: List of unique page URLs to scrape, sorted by page number
         """
-        res = requests.get(self.BASE_URL, headers=self.headers)
-        soup = BeautifulSoup(res.content, "html.parser")
+        res = self._get_session().get(self.BASE_URL)
+        self._prefetched_pages[self.BASE_URL] = res.content
+        soup = BeautifulSoup(res.content, HTML_PARSER)
 
-        page_links = soup.select("a.sc-65de7bd2-2[href*='page=']")
+        page_links = COMPILED_SELECTORS["pagination_link"].select(soup)
         urls = set()
 
         for a in page_links:
@@ -113,7 +175,7 @@ class EEScraper:
         if len(urls) < 10:
             self.logger.info(f"Found only {len(urls)} pages, trying alternative pagination selectors...")
             
-            alt_page_links = soup.select("a[href*='page='], .pagination a, nav a, [class*='page'] a")
+            alt_page_links = COMPILED_SELECTORS["pagination_fallback"].select(soup)
             for a in alt_page_links:
                 href = a.get("href")
                 if isinstance(href, list):
@@ -125,31 +187,20 @@ class EEScraper:
             
             self.logger.info(f"After alternative selectors: {len(urls)} pages")
         
-        if len(urls) < 20:
-            self.logger.info("Generating page URLs manually (limited to 20 pages)...")
-            
-            for page_num in range(0, 1):
-                pattern = f"{self.BASE_URL}?page={page_num}"
-                urls.add(pattern)
-            
-            self.logger.info(f"After manual generation: {len(urls)} pages")
-        
-        def extract_page_number(url):
-            if "page=" in url:
-                try:
-                    return int(url.split("page=")[1].split("&")[0])
-                except:
-                    return 0
-            return 0
+        urls_by_page = {}
+        for url in sorted(urls):
+            urls_by_page.setdefault(self._page_number(url), url)
+        urls_by_page[0] = self.BASE_URL
         
-        sorted_urls = sorted(urls, key=extract_page_number)
+        # Widgets like "1 2 3 ... 17" skip middle pages; fill those in rather than guessing a range
+        last_page = max(urls_by_page)
+        missing_pages = [page_num for page_num in range(1, last_page + 1) if page_num not in urls_by_page]
+        if missing_pages:
+            self.logger.info(f"Filling in {len(missing_pages)} pages missing from pagination up to page {last_page}")
+            for page_num in missing_pages:
+                urls_by_page[page_num] = f"{self.BASE_URL}?page={page_num}"
         
-        unique_urls = []
-        seen = set()
-        for url in sorted_urls:
-            if url not in seen:
-                unique_urls.append(url)
-                seen.add(url)
+        unique_urls = [urls_by_page[page_num] for page_num in sorted(urls_by_page)]
         
         self.logger.info(f"Found {len(unique_urls)} unique pages to scrape")
         
@@ -160,6 +211,81 @@ class EEScraper:
         
         return unique_urls
 
+    @staticmethod
+    def _container_rank(tag):
+        """
+        Rank a listing-page tag by how specifically it looks like a product container.
+        
+        Lower ranks are preferred; each rank stands for one of the container selectors
+        the listing markup has used over time, from the current styled-component class
+        down to generic fragments.
+        
+        Args:
+            tag: div or article tag from a listing page
+            
+        Returns:
+            int or None: Rank from 0 to 4, or None if the tag is no container candidate
+        """
+        if tag.name == "article":
+            return 3
+        classes = tag.get("class") or ()
+        if "sc-3ff391e0-5" in classes:
+            return 0 if "duSkO" in classes else 1
+        class_attr = " ".join(classes)
+        if "product" in class_attr or "item" in class_attr:
+            return 2
+        if "card" in class_attr:
+            return 3
+        if "sc-" in class_attr:
+            return 4
+        return None
+
+    def find_product_divs(self, soup):
+        """
+        Find the product containers on a parsed listing page in a single walk.
+        
+        Every div and article is ranked once and only the best-ranked candidates are
+        kept, in document order. If no tag ranks at all, a div is accepted when it
+        contains a name, a price and a product link; those are found with one query each
+        over the page, marking the enclosing divs, instead of three queries per div.
+        
+        Args:
+            soup (BeautifulSoup): Parsed listing page
+            
+        Returns:
+            list: Product container tags in document order
+        """
+        candidates = soup.find_all(["div", "article"])
+        best_rank = None
+        product_divs = []
+        for tag in candidates:
+            rank = self._container_rank(tag)
+            if rank is None or (best_rank is not None and rank > best_rank):
+                continue
+            if rank != best_rank:
+                best_rank = rank
+                product_divs = []
+            product_divs.append(tag)
+        
+        if product_divs:
+            return product_divs
+        
+        marked = []
+        for selector in (COMPILED_SELECTORS["fallback_name"], COMPILED_SELECTORS["price_hint"],
+                         COMPILED_SELECTORS["product_link_hint"]):
+            enclosing = set()
+            for node in selector.select(soup):
+                for parent in node.parents:
+                    if id(parent) in enclosing:
+                        break
+                    enclosing.add(id(parent))
+            marked.append(enclosing)
+        
+        return [
+            tag for tag in candidates
+            if tag.name == "div" and all(id(tag) in enclosing for enclosing in marked)
+        ]
+
     def get_product_links(self, page_url):
         """
         Extract product links from a listing page.
@@ -170,13 +296,13 @@ class EEScraper:
         Returns:
             list: List of product URLs found on the page
         """
-        res = requests.get(page_url, headers=self.headers)
-        soup = BeautifulSoup(res.content, "html.parser")
+        res = self._get_session().get(page_url)
+        soup = BeautifulSoup(res.content, HTML_PARSER)
 
         product_links = []
     
-        for product_div in soup.select("div[class*='product'], article, .product-item"):
-            a_tag = product_div.select_one("a[href]")
+        for product_div in COMPILED_SELECTORS["listing_product"].select(soup):
+            a_tag = COMPILED_SELECTORS["fallback_link"].select_one(product_div)
             if a_tag:
                 href = a_tag.get("href")
                 if isinstance(href, list):
@@ -189,12 +315,84 @@ class EEScraper:
         self.logger.info(f"Found {len(product_links)} product links on {page_url}")
         return product_links
 
+    async def _throttle(self, url):
+        """
+        Wait until a request to url's host may start, spacing starts self.sleep apart.
+        
+        Each call reserves the next free start time for the host, so time already spent
+        on earlier requests counts towards the delay instead of being added to it.
+        
+        Args:
+            url (str): URL about to be requested
+        """
+        host = urlparse(url).netloc
+        now = time.monotonic()
+        start_at = max(now, self._next_request_at.get(host, now))
+        self._next_request_at[host] = start_at + self.sleep
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+
+    async def _fetch_page(self, session, url, semaphore):
+        """
+        Download one page, waiting for a free slot in the concurrency limit.
+        
+        Args:
+            session (aiohttp.ClientSession): Shared session for all page downloads
+            url (str): URL of the page to download
+            semaphore (asyncio.Semaphore): Limits the number of downloads in flight
+            
+        Returns:
+            bytes: Raw page body, or empty bytes if the download failed
+        """
+        await self._throttle(url)
+        async with semaphore:
+            try:
+                async with session.get(url) as response:
+                    return await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.warning(f"Failed to fetch {url}: {e}")
+                return b""
+
+    async def _open_session(self):
+        """Create the pooled aiohttp session; called inside the event loop that will use it."""
+        timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT)
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, ttl_dns_cache=DNS_CACHE_TTL)
+        return aiohttp.ClientSession(headers=self.headers, timeout=timeout, connector=connector)
+
+    async def _fetch_with_session(self, session, urls):
+        """Download urls over an open session, keeping their order."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        return await asyncio.gather(*(self._fetch_page(session, url, semaphore) for url in urls))
+
+    async def _fetch_pages_async(self, urls):
+        """Download all urls over one pooled session, keeping their order."""
+        async with await self._open_session() as session:
+            return await self._fetch_with_session(session, urls)
+
+    def fetch_pages(self, urls):
+        """
+        Download several pages concurrently.
+        
+        Network waits overlap across pages instead of running one after another,
+        with at most max_concurrency requests in flight.
+        
+        Args:
+            urls (list): Page URLs to download
+            
+        Returns:
+            list: Raw page bodies in the same order as urls (empty bytes for failures)
+        """
+        if not urls:
+            return []
+        return asyncio.run(self._fetch_pages_async(urls))
+
     def parse_product_details(self, product_url):
         """
         Parse detailed product information from a product page.
         
         This method extracts comprehensive product details including SKU, specifications,
-        warranty information, and detailed specs from product tables.
+        warranty information, and detailed specs from product tables. Successful results
+        are cached per URL for the lifetime of the scraper.
         
         Args:
             product_url (str): URL of the product page to parse
@@ -202,48 +400,58 @@ class EEScraper:
         Returns:
             dict: Dictionary containing detailed product information
         """
+        if product_url in self._details_cache:
+            return dict(self._details_cache[product_url])
+        
         try:
-            res = requests.get(product_url, headers=self.headers)
-            soup = BeautifulSoup(res.content, "html.parser")
-            
-            sku = ""
-            sku_element = soup.select_one("span.sc-235e453a-19.eOnNNp")
-            if sku_element:
-                sku = sku_element.text.strip()
-            
-            specs = []
-            spec_elements = soup.select("li.sc-235e453a-27.khePzm")
-            for spec in spec_elements:
-                specs.append(spec.text.strip())
-            
-            warranty = ""
-            warranty_elements = soup.select("div.sc-235e453a-24.hVytZX a")
-            if warranty_elements:
-                warranty_texts = [elem.text.strip() for elem in warranty_elements]
-                warranty = " | ".join(warranty_texts)
-            
-            detailed_specs = {}
-            spec_tables = soup.select("table.sc-bc705976-4.bbQIJZ")
-            for table in spec_tables:
-                rows = table.select("tr.sc-bc705976-6.UicTo")
-                for row in rows:
-                    cells = row.select("td.sc-bc705976-7")
-                    if len(cells) >= 2:
-                        key = cells[0].text.strip().replace(":", "")
-                        value = cells[1].text.strip()
-                        detailed_specs[key] = value
-            
-            return {
-                'sku': sku,
-                'specifications': specs,
-                'warranty': warranty,
-                'detailed_specs': detailed_specs
-            }
+            res = self._get_session().get(product_url)
+            details = self._parse_details_content(res.content)
         except Exception as e:
             self.logger.warning(f"Failed to parse product details from {product_url}: {e}")
             return {}
+        
+        self._details_cache[product_url] = details
+        return dict(details)
 
-    def parse_product_from_listing(self, product_div):
+    def _parse_details_content(self, content):
+        """Extract SKU, specifications, warranty and spec tables from a product page body."""
+        soup = BeautifulSoup(content, HTML_PARSER)
+        
+        sku = ""
+        sku_element = COMPILED_SELECTORS["detail_sku"].select_one(soup)
+        if sku_element:
+            sku = sku_element.text.strip()
+        
+        specs = []
+        spec_elements = COMPILED_SELECTORS["detail_specs"].select(soup)
+        for spec in spec_elements:
+            specs.append(spec.text.strip())
+        
+        warranty = ""
+        warranty_elements = COMPILED_SELECTORS["detail_warranty"].select(soup)
+        if warranty_elements:
+            warranty_texts = [elem.text.strip() for elem in warranty_elements]
+            warranty = " | ".join(warranty_texts)
+        
+        detailed_specs = {}
+        spec_tables = COMPILED_SELECTORS["detail_spec_table"].select(soup)
+        for table in spec_tables:
+            rows = COMPILED_SELECTORS["detail_spec_row"].select(table)
+            for row in rows:
+                cells = COMPILED_SELECTORS["detail_spec_cell"].select(row)
+                if len(cells) >= 2:
+                    key = cells[0].text.strip().replace(":", "")
+                    value = cells[1].text.strip()
+                    detailed_specs[key] = value
+        
+        return {
+            'sku': sku,
+            'specifications': specs,
+            'warranty': warranty,
+            'detailed_specs': detailed_specs
+        }
+
+    def parse_product_from_listing(self, product_div, created_at=None):
         """
         Parse product information directly from a listing page product div.
         
@@ -253,51 +461,46 @@ class EEScraper:
         
         Args:
             product_div: BeautifulSoup element containing product information
+            created_at (str, optional): ISO timestamp to record on the product.
+                                        Defaults to the current time.
             
         Returns:
             dict: Product information dictionary, or None if parsing fails
         """
         try:
-            name_tag = product_div.select_one("h3.sc-3ff391e0-4, h3.iwNALa")
+            name_tag = COMPILED_SELECTORS["product_name"].select_one(product_div)
             if not name_tag:
-                name_tag = product_div.select_one("h3, h2, .product-title, .title")
+                name_tag = COMPILED_SELECTORS["fallback_name"].select_one(product_div)
             name = name_tag.text.strip() if name_tag else "Unknown"
 
             if not name or name == "Unknown" or len(name) < 3:
-                self.logger.debug(f"Skipping product with invalid name: '{name}'")
+                self.logger.debug("Skipping product with invalid name: '%s'", name)
                 return None
 
-            link_tag = product_div.select_one("a.sc-3ff391e0-3, a.iwNALa")
+            link_tag = COMPILED_SELECTORS["listing_link"].select_one(product_div)
             if not link_tag:
-                link_tag = product_div.select_one("a[href]")
+                link_tag = COMPILED_SELECTORS["fallback_link"].select_one(product_div)
             
             link = link_tag.get("href") if link_tag else None
             if isinstance(link, list):
                 link = link[0] if link else None
             
             if not link:
-                self.logger.debug(f"Skipping product '{name}' - no link found")
+                self.logger.debug("Skipping product '%s' - no link found", name)
                 return None
 
-            if "/mobile-phone" not in link and "/cable" not in link and "/accessory" not in link:
-                self.logger.debug(f"Skipping product '{name}' - link doesn't contain mobile-related path: {link}")
+            category = next((category for path, category in LINK_PATH_CATEGORIES if path in link), None)
+            if category is None:
+                self.logger.debug("Skipping product '%s' - link doesn't contain mobile-related path: %s", name, link)
                 return None
 
             if link.startswith("/"):
                 link = f"https://beta.ee.ge{link}"
 
-            price_tag = product_div.select_one("span.sc-3ff391e0-6, span.iwNALa")
+            price_tag = COMPILED_SELECTORS["listing_price"].select_one(product_div)
             if not price_tag:
-                price_selectors = [
-                    "span[class*='price']",
-                    "div[class*='price']", 
-                    "span:contains('₾')",
-                    "[class*='cost']",
-                    "span",
-                    "div"
-                ]
-                for selector in price_selectors:
-                    price_tag = product_div.select_one(selector)
+                for selector in COMPILED_PRICE_FALLBACKS:
+                    price_tag = selector.select_one(product_div)
                     if price_tag and '₾' in price_tag.text:
                         break
 
@@ -305,28 +508,22 @@ class EEScraper:
             
             price = 0
             try:
-                price_clean = price_text.replace('₾', '').replace(' ', '').replace(',', '')
+                price_clean = price_text.translate(LISTING_PRICE_STRIP_TABLE)
                 price = int(float(price_clean))
             except (ValueError, AttributeError):
-                self.logger.debug(f"Skipping product '{name}' - invalid price: '{price_text}'")
+                self.logger.debug("Skipping product '%s' - invalid price: '%s'", name, price_text)
                 return None
 
             if price <= 0:
-                self.logger.debug(f"Skipping product '{name}' - zero or negative price: {price}")
+                self.logger.debug("Skipping product '%s' - zero or negative price: %s", name, price)
                 return None
 
             brand = name.split()[0] if name else "Unknown"
             
             if brand == "Unknown":
-                self.logger.debug(f"Skipping product '{name}' - unknown brand")
+                self.logger.debug("Skipping product '%s' - unknown brand", name)
                 return None
 
-            category = 'phones'
-            if '/cable' in link:
-                category = 'accessories'
-            elif '/accessory' in link:
-                category = 'accessories'
-
             product = {
                 'name': name,
                 'price': price,
@@ -335,25 +532,68 @@ class EEScraper:
                 'source': 'ee.ge',
                 'category': category,
                 'description': f"Stock: Available, SKU: {brand}-{price}, Warranty: 12 months, Specs: {category.title()}, URL: {link}",
-                'createdat': datetime.now().isoformat()
+                'createdat': created_at or datetime.now().isoformat()
             }
 
             return product
 
         except Exception as e:
-            self.logger.debug(f"Error parsing product: {str(e)}")
+            self.logger.debug("Error parsing product: %s", e)
             return None
 
+    def _iter_listing_contents(self, listing_pages):
+        """
+        Yield listing page bodies in order, downloading one batch of pages at a time.
+        
+        Each batch holds max_concurrency pages fetched concurrently; the next batch is
+        only requested once the caller has consumed the current one, so a caller that
+        stops early does not pay for the rest of the catalogue. All batches share one
+        event loop and one aiohttp session (and so its connection pool), closed when
+        the generator finishes or is closed. Pages already downloaded by
+        get_all_listing_pages are reused instead of fetched again.
+        
+        Args:
+            listing_pages (list): Listing page URLs in scraping order
+            
+        Yields:
+            tuple: (page URL, raw page body; empty bytes if the download failed)
+        """
+        prefetched = self._prefetched_pages
+        loop = session = None
+        try:
+            for start in range(0, len(listing_pages), self.max_concurrency):
+                batch = listing_pages[start:start + self.max_concurrency]
+                pending = [page for page in batch if page not in prefetched]
+                bodies = []
+                if pending:
+                    self.logger.info(f"Downloading listing pages {start + 1}-{start + len(batch)} of {len(listing_pages)}...")
+                    if loop is None:
+                        loop = asyncio.new_event_loop()
+                        session = loop.run_until_complete(self._open_session())
+                    bodies = loop.run_until_complete(self._fetch_with_session(session, pending))
+                downloaded = dict(zip(pending, bodies))
+                for page in batch:
+                    yield page, prefetched[page] if page in prefetched else downloaded[page]
+        finally:
+            prefetched.clear()
+            if loop is not None:
+                if session is not None:
+                    loop.run_until_complete(session.close())
+                loop.close()
+
     def run(self):
         """
         Execute the main scraping process.
         
         This method orchestrates the entire scraping workflow:
-        1. Fetches all listing pages
+        1. Fetches listing pages in batches of max_concurrency
         2. Iterates through each page
         3. Extracts product information
         4. Saves results to JSON file
         
+        No further batches are downloaded once max_products is reached or
+        too many consecutive pages come back empty.
+        
         Returns:
             list: List of scraped product dictionaries
         """
@@ -364,29 +604,14 @@ class EEScraper:
         consecutive_empty_pages = 0
         max_empty_pages = 3
 
-        for page_num, page in enumerate(listing_pages, 1):
+        # One timestamp for the whole crawl instead of formatting a new one per product
+        created_at = datetime.now().isoformat()
+
+        for page_num, (page, content) in enumerate(self._iter_listing_contents(listing_pages), 1):
             self.logger.info(f"Scraping page {page_num}/{len(listing_pages)}: {page}")
-            res = requests.get(page, headers=self.headers)
-            soup = BeautifulSoup(res.content, "html.parser")
-
-            product_divs = soup.select("div.sc-3ff391e0-5.duSkO")
-            if not product_divs:
-                product_divs = soup.select("div.sc-3ff391e0-5")
-            if not product_divs:
-                product_divs = soup.select("div[class*='product'], div[class*='item']")
-            if not product_divs:
-                product_divs = soup.select("div[class*='card'], div[class*='product'], article")
-            if not product_divs:
-                product_divs = soup.select("div[class*='sc-'], div[class*='item'], div[class*='product']")
-            if not product_divs:
-                product_divs = []
-                for div in soup.select("div"):
-                    has_name = div.select_one("h3, h2, .product-title, .title")
-                    has_price = div.select_one("span:contains('₾'), [class*='price']")
-                    has_link = div.select_one("a[href*='/mobile-phone'], a[href*='/en/']")
-                    
-                    if has_name and has_price and has_link:
-                        product_divs.append(div)
+            soup = BeautifulSoup(content, HTML_PARSER)
+
+            product_divs = self.find_product_divs(soup)
             
             self.logger.info(f"Found {len(product_divs)} potential product divs on page {page_num}")
             
@@ -405,26 +630,28 @@ class EEScraper:
                 if self.max_products and len(all_products) >= self.max_products:
                     break
                     
-                product = self.parse_product_from_listing(product_div)
+                product = self.parse_product_from_listing(product_div, created_at)
                 if product and product.get('name') != "Unknown" and product.get('price', 0) > 0:
                     all_products.append(product)
                     page_products += 1
                     self.logger.info(f"Added product: {product.get('name')} - {product.get('price')} GEL")
                 else:
                     if i < 3:
-                        name_elem = product_div.select_one("h3, h2, .product-title, .title")
-                        price_elem = product_div.select_one("[class*='price'], [class*='cost'], span:contains('₾')")
-                        link_elem = product_div.select_one("a[href]")
+                        name_elem = COMPILED_SELECTORS["fallback_name"].select_one(product_div)
+                        price_elem = COMPILED_SELECTORS["rejected_price"].select_one(product_div)
+                        link_elem = COMPILED_SELECTORS["fallback_link"].select_one(product_div)
                         
                         name_text = name_elem.text.strip() if name_elem else "No name"
                         price_text = price_elem.text.strip() if price_elem else "No price"
                         link_href = link_elem.get('href') if link_elem else "No link"
                         
                         self.logger.info(f"Rejected div {i+1}: Name='{name_text[:50]}', Price='{price_text}', Link='{link_href[:50] if link_href else 'No link'}'")
-                time.sleep(self.sleep)
 
             self.logger.info(f"Found {page_products} valid products on page {page_num}")
-            time.sleep(self.sleep)
+            
+            if self.max_products and len(all_products) >= self.max_products:
+                self.logger.info(f"Reached max_products ({self.max_products}), not fetching further pages")
+                break
 
         if all_products:
             project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
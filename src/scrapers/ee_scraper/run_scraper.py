@@ -157,10 +157,10 @@ def main():
         report_base = os.path.join(project_root, "data_output", "reports")
         report_folder = get_next_incremented_folder(report_base, "report")
         logger.info(f"Running analysis, reports will be saved in: {report_folder}")
-        # Find processed JSON files in processed_folder
-        processed_files = [str(f) for f in Path(processed_folder).glob("*.json")]
+        # Find processed Parquet/JSON files in processed_folder
+        processed_files = [str(f) for pattern in ("*.parquet", "*.json") for f in Path(processed_folder).glob(pattern)]
         if not processed_files:
-            logger.warning(f"No processed JSON files found in {processed_folder}")
+            logger.warning(f"No processed files found in {processed_folder}")
             return
         import pandas as pd
         from src.analysis.statistics import StatisticalAnalyzer
@@ -1,7 +1,8 @@
 import json
 import os
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import create_engine
 from itemadapter import ItemAdapter
@@ -119,13 +120,44 @@ class DatabasePipeline:
             self.logger.error(f"Failed to connect to database: {e}")
             self.engine = None
 
+    @staticmethod
+    def _parse_price(price):
+        """Convert a price to Decimal for the numeric price column.
+
+        Currency signs and spaces are dropped first, so prices that skipped ValidationPipeline
+        still parse. The last ',' or '.' is the decimal point when exactly two digits follow it
+        ('1.299,99', '1,299.99'); every other separator groups thousands and is dropped.
+        Raises ValueError when no number remains.
+        """
+        if price in (None, ''):
+            return None
+        if isinstance(price, (int, float, Decimal)):
+            return Decimal(str(price))
+        text = ''.join(c for c in str(price) if c.isdigit() or c in '.,')
+        point = max(text.rfind('.'), text.rfind(','))
+        if point != -1 and len(text) - point == 3:
+            digits = text[:point].replace('.', '').replace(',', '') + '.' + text[point + 1:]
+        else:
+            digits = text.replace('.', '').replace(',', '')
+        try:
+            return Decimal(digits)
+        except InvalidOperation:
+            raise ValueError(f"Unparseable price: {price!r}")
+
     def process_item(self, item, spider):
         if not self.engine:
             return item
 
         try:
-            session = self.Session()
             adapter = ItemAdapter(item)
+            try:
+                price = self._parse_price(adapter.get('price'))
+            except ValueError as e:
+                # Rejected rather than stored as NULL, which would erase a known price on update
+                self.logger.warning(f"Not saving {adapter.get('url')} to database: {e}")
+                return item
+
+            session = self.Session()
 
             # Import here to avoid circular imports
             from src.data.models import Product
@@ -138,14 +170,14 @@ class DatabasePipeline:
 
             if existing_item:
                 # Update existing item
-                existing_item.price = adapter.get('price')
+                existing_item.price = price
                 existing_item.description = adapter.get('description')
-                existing_item.created_at = datetime.now()
+                existing_item.created_at = datetime.now(timezone.utc)
             else:
                 # Create new item
                 product = Product(
                     name=adapter.get('name'),
-                    price=adapter.get('price'),
+                    price=price,
                     brand=adapter.get('brand'),
                     category=adapter.get('category'),
                     description=adapter.get('description')
@@ -22,6 +22,12 @@ import json
 import csv
 import os
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 @dataclass
 class Product:
@@ -107,8 +113,13 @@ def save_products_to_json(products: List, filename: str = "products.json"):
     os.makedirs("data_output", exist_ok=True)
     filepath = os.path.join("data_output", filename)
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    if HAS_ORJSON:
+        # One native encode instead of json.dump's many small indented writes; orjson emits UTF-8 bytes
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
 
     return filepath
 
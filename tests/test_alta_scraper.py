@@ -0,0 +1,126 @@
+"""
+Unit tests for the Alta scraper module.
+"""
+
+import unittest
+import os
+from unittest.mock import patch, MagicMock
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'scrapers', 'alta_scraper'))
+
+from alta_config import AltaConfig
+from alta_selenium_scraper import AltaScraper
+from alta_utilities import AltaUtilities
+
+
+def phone_tile(name, slug, price, container_class="sc-4a8e2816-1"):
+    """Server-rendered phone tile in the markup shape the phones selectors target."""
+    return (
+        f'<div class="{container_class}">'
+        f'<a href="/mobile-phones/{slug}"><img src="/images/{slug}.jpg"></a>'
+        f'<h2 class="sc-4a8e2816-2">{name}</h2>'
+        f'<span class="sc-88de82a8-3">{price} ₾</span>'
+        f'</div>'
+    )
+
+
+def listing_html(*tiles):
+    return f'<html><body><main>{"".join(tiles)}</main></body></html>'
+
+
+class TestAltaStaticFetch(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.scraper = AltaScraper(max_products=50)
+        self.url = AltaConfig.CATEGORY_URLS['phones']
+
+    def fetch(self, html):
+        response = MagicMock(text=html)
+        with patch('requests.Session.get', return_value=response) as mock_get:
+            products = self.scraper._try_static_fetch(self.url, 'phones')
+        mock_get.assert_called_once()
+        return products
+
+    def phone_tiles(self, count):
+        return [phone_tile(f"Samsung Galaxy A{i} 128GB", f"galaxy-a{i}", 400 + i) for i in range(count)]
+
+    def test_extracts_fields(self):
+        """Test name, price, brand, URLs and tags are read from each tile."""
+        products = self.fetch(listing_html(*self.phone_tiles(AltaConfig.STATIC_MIN_PRODUCTS)))
+
+        self.assertEqual(len(products), AltaConfig.STATIC_MIN_PRODUCTS)
+        first = products[0]
+        self.assertEqual(first['name'], "Samsung Galaxy A0 128GB")
+        self.assertEqual(first['price'], 400.0)
+        self.assertEqual(first['brand'], "Samsung")
+        self.assertEqual(first['product_url'], "https://alta.ge/mobile-phones/galaxy-a0")
+        self.assertEqual(first['image_url'], "https://alta.ge/images/galaxy-a0.jpg")
+        self.assertEqual(first['category'], 'phones')
+        self.assertIn('createdat', first)
+
+    def test_first_matching_selector_wins(self):
+        """Test tiles of a later container selector are ignored once an earlier one matches."""
+        later_tiles = [
+            phone_tile(f"Apple iPhone {i} 256GB", f"iphone-{i}", 900 + i, container_class="sc-35fd0e08-0")
+            for i in range(3)
+        ]
+        products = self.fetch(listing_html(*later_tiles, *self.phone_tiles(AltaConfig.STATIC_MIN_PRODUCTS)))
+
+        self.assertEqual(len(products), AltaConfig.STATIC_MIN_PRODUCTS)
+        self.assertTrue(all(product['brand'] == "Samsung" for product in products))
+
+    def test_deduplicates_product_urls(self):
+        """Test tiles linking to the same product are kept once."""
+        tiles = self.phone_tiles(AltaConfig.STATIC_MIN_PRODUCTS)
+        products = self.fetch(listing_html(*tiles, tiles[0], tiles[1]))
+
+        urls = [product['product_url'] for product in products]
+        self.assertEqual(len(urls), AltaConfig.STATIC_MIN_PRODUCTS)
+        self.assertEqual(len(set(urls)), len(urls))
+
+    def test_too_few_products_falls_back_to_browser(self):
+        """Test fewer than STATIC_MIN_PRODUCTS tiles returns nothing so the browser is used."""
+        products = self.fetch(listing_html(*self.phone_tiles(AltaConfig.STATIC_MIN_PRODUCTS - 1)))
+        self.assertEqual(products, [])
+
+    def test_small_max_products_lowers_threshold(self):
+        """Test the fallback threshold never exceeds max_products."""
+        self.scraper.max_products = 3
+        products = self.fetch(listing_html(*self.phone_tiles(5)))
+        self.assertEqual(len(products), 3)
+
+    def test_fetch_error_falls_back_to_browser(self):
+        """Test a failed request returns nothing."""
+        with patch('requests.Session.get', side_effect=ConnectionError("offline")):
+            self.assertEqual(self.scraper._try_static_fetch(self.url, 'phones'), [])
+
+
+class TestAltaBrandExtraction(unittest.TestCase):
+
+    def test_brand_touching_digits(self):
+        """Test a brand followed directly by a model number is matched."""
+        self.assertEqual(AltaUtilities.extract_brand_from_name("iPhone15"), "iPhone")
+        self.assertEqual(AltaUtilities.extract_brand_from_name("Galaxy S24 Ultra"), "Galaxy")
+
+    def test_brand_inside_word_ignored(self):
+        """Test 'Mi' inside 'Premium' is not taken as a brand."""
+        self.assertEqual(AltaUtilities.extract_brand_from_name("Premium Case"), "Premium")
+
+    def test_leftmost_brand_wins(self):
+        """Test the first brand in the name wins over the brand list order."""
+        self.assertEqual(AltaUtilities.extract_brand_from_name("Case for Samsung and Apple phones"), "Samsung")
+        self.assertEqual(AltaUtilities.extract_brand_from_name("Xiaomi Redmi Note 13"), "Xiaomi")
+
+    def test_first_word_fallback(self):
+        """Test names without a known brand fall back to their first word."""
+        self.assertEqual(AltaUtilities.extract_brand_from_name("Zebronics Speaker"), "Zebronics")
+        self.assertEqual(AltaUtilities.extract_brand_from_name("new phone"), "Unknown")
+        self.assertEqual(AltaUtilities.extract_brand_from_name("TV"), "Unknown")
+        self.assertEqual(AltaUtilities.extract_brand_from_name(""), "Unknown")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -68,6 +68,27 @@ class TestStatisticalAnalyzer(unittest.TestCase):
         self.assertIn('outliers', analysis)
         self.assertIn('price_segments', analysis)
     
+    def test_price_distribution_large_sample(self):
+        """Test that large samples use Anderson-Darling instead of Shapiro-Wilk."""
+        # Slightly skewed, so the statistic falls inside the tabulated range rather than at a clamp
+        prices = np.random.default_rng(0).gamma(300, 1, 6000)
+        analyzer = StatisticalAnalyzer(pd.DataFrame({'price': prices}))
+        
+        tests = analyzer.price_distribution_analysis()['distribution_tests']
+        
+        self.assertNotIn('shapiro_wilk', tests)
+        self.assertAlmostEqual(tests['anderson_darling']['statistic'], 0.708, places=3)
+        self.assertAlmostEqual(tests['anderson_darling']['p_value'], 0.068, places=3)
+    
+    def test_input_not_mutated(self):
+        """Test that preparing the analyzer leaves the caller's frame untouched."""
+        raw_data = self.sample_data.assign(price=self.sample_data['price'].astype(str))
+        analyzer = StatisticalAnalyzer(raw_data)
+        
+        self.assertIs(analyzer.data, raw_data)
+        self.assertEqual(raw_data['price'].dtype, object)
+        self.assertEqual(analyzer.descriptive_statistics()['price_statistics']['mean'], 799.0)
+    
     def test_empty_data(self):
         """Test with empty dataframe."""
         empty_data = pd.DataFrame(columns=self.sample_data.columns)
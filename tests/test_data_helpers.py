@@ -12,6 +12,7 @@ from unittest.mock import patch, mock_open
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from src.utils import data_helpers
 from src.utils.data_helpers import (
     Product, save_products_to_json, save_products_to_csv,
     extract_brand_from_name, clean_price
@@ -62,6 +63,7 @@ class TestDataHelpers(unittest.TestCase):
         self.assertEqual(clean_price("$999.99"), "999.99")
         self.assertEqual(clean_price(""), "N/A")
     
+    @patch('src.utils.data_helpers.HAS_ORJSON', False)
     @patch('builtins.open', new_callable=mock_open)
     def test_save_with_mock(self, mock_file):
         """Test saving with mocked file."""
@@ -70,6 +72,19 @@ class TestDataHelpers(unittest.TestCase):
         
         self.assertEqual(result, filepath)
         mock_file.assert_called_once_with(filepath, 'w', encoding='utf-8')
+    
+    @unittest.skipUnless(data_helpers.HAS_ORJSON, "orjson not installed")
+    @patch('builtins.open', new_callable=mock_open)
+    def test_save_with_orjson_writes_bytes(self, mock_file):
+        """Test the orjson path writes its encoded bytes to a binary file."""
+        filepath = "/test/path/products.json"
+        result = save_products_to_json(self.test_products, filepath)
+        
+        self.assertEqual(result, filepath)
+        mock_file.assert_called_once_with(filepath, 'wb')
+        written = mock_file().write.call_args[0][0]
+        self.assertIsInstance(written, bytes)
+        self.assertEqual(json.loads(written)[0]['name'], self.test_products[0].name)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,182 @@
+"""
+Unit tests for data processing module.
+"""
+
+import unittest
+import pandas as pd
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data.processors import DataAggregator, DataProcessor
+
+
+class TestDataProcessor(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up test data."""
+        self.sample_data = pd.DataFrame({
+            'name': ['iPhone 13', 'Galaxy S21', 'X', 'Mi 11'],
+            'price': ['999', 'abc', 799, 60000],
+            'brand': ['Apple', 'Samsung', 'Xiaomi', ''],
+            'category': ['phones', 'phones', 'cars', 'phones'],
+            'source': ['ee.ge', 'alta.ge', 'ee.ge', 'amazon.com'],
+            'createdat': [
+                '2024-01-01T10:00:00Z',
+                '2024-01-02T10:00:00',
+                'yesterday',
+                '2024-01-04T10:00:00'
+            ]
+        })
+        self.processor = DataProcessor()
+    
+    def test_validate_data(self):
+        """Test that invalid rows are reported and dropped."""
+        clean_df, report = self.processor.validate_data(self.sample_data)
+        
+        self.assertEqual(list(clean_df.index), [0])
+        self.assertEqual(report['valid_records'], 1)
+        self.assertEqual(report['issues']['invalid_prices']['count'], 2)
+        self.assertEqual(list(report['issues']['invalid_prices']['indices']), [1, 3])
+        
+        issues = self.processor.format_report(report)['issues']
+        self.assertEqual(issues['missing_fields'], ["Row 3: missing brand"])
+        self.assertEqual(issues['invalid_prices'], [
+            "Row 1: invalid price format",
+            "Row 3: price 60000.0 out of range"
+        ])
+        self.assertEqual(issues['invalid_categories'], ["Row 2: invalid category 'cars'"])
+        self.assertEqual(issues['invalid_sources'], ["Row 3: invalid source 'amazon.com'"])
+        self.assertEqual(issues['invalid_names'], ["Row 2: name too short"])
+        self.assertEqual(issues['invalid_dates'], ["Row 2: invalid date format"])
+    
+    def test_clean_data_mixed_timezones(self):
+        """Test that timestamps parsed during validation are normalized to UTC."""
+        df = self.sample_data.iloc[[0, 0, 0]].reset_index(drop=True)
+        df['createdat'] = ['2024-01-01T10:00:00Z', '2024-01-01T14:00:00+04:00', '2024-01-01T10:00:00']
+        
+        valid_df, _ = self.processor.validate_data(df)
+        cleaned_df = self.processor.clean_data(valid_df)
+        
+        self.assertNotIn('createdat_parsed', cleaned_df.columns)
+        self.assertEqual(cleaned_df['scrape_hour'].tolist(), [10, 10, 10])
+    
+    def test_parse_timestamps_datetime_objects(self):
+        """Test object columns holding datetime objects, alone or mixed with strings."""
+        plain = pd.Series([datetime(2024, 1, 1)], dtype=object)
+        self.assertEqual(DataProcessor._parse_timestamps(plain).tolist(), [pd.Timestamp('2024-01-01', tz='UTC')])
+        
+        mixed = pd.Series([
+            datetime(2024, 1, 1, 14, tzinfo=timezone(timedelta(hours=4))),
+            '2024-01-02T10:00:00Z',
+            'yesterday',
+        ], dtype=object)
+        self.assertEqual(DataProcessor._parse_timestamps(mixed).tolist(), [
+            pd.Timestamp('2024-01-01T10:00:00', tz='UTC'),
+            pd.Timestamp('2024-01-02T10:00:00', tz='UTC'),
+            pd.NaT,
+        ])
+    
+    def test_deduplicate_object_timestamps(self):
+        """Test deduplication keeps the latest record when createdat holds mixed-offset datetimes."""
+        df = pd.DataFrame({
+            'name': ['iPhone 13', 'iPhone 13'],
+            'source': ['ee.ge', 'ee.ge'],
+            'price': [999, 949],
+            'createdat': pd.Series([
+                datetime(2024, 1, 1, 14, tzinfo=timezone(timedelta(hours=4))),
+                datetime(2024, 1, 1, 11, tzinfo=timezone.utc),
+            ], dtype=object),
+        })
+        
+        deduped = DataAggregator().deduplicate_data(df)
+        self.assertEqual(deduped['price'].tolist(), [949])
+    
+    def test_clean_data_input_not_mutated(self):
+        """Test that clean_data leaves the caller's DataFrame unchanged."""
+        valid_df, _ = self.processor.validate_data(self.sample_data)
+        original = valid_df.copy()
+        
+        self.processor.clean_data(valid_df)
+        
+        pd.testing.assert_frame_equal(valid_df, original)
+    
+    def test_load_raw_data_formats(self):
+        """Test loading JSON arrays and JSON Lines in chunks."""
+        records = [{'name': 'iPhone 13', 'price': '999'}, {'name': 'Galaxy S21', 'price': 799}]
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            array_path = os.path.join(tmp_dir, 'products.json')
+            with open(array_path, 'w', encoding='utf-8') as f:
+                json.dump(records, f, indent=2)
+            
+            lines_path = os.path.join(tmp_dir, 'products.jsonl')
+            with open(lines_path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(json.dumps(record) for record in records))
+            
+            padded_path = os.path.join(tmp_dir, 'padded.json')
+            with open(padded_path, 'w', encoding='utf-8') as f:
+                f.write('\n  \n' + json.dumps(records))
+            
+            for path in (array_path, lines_path, padded_path):
+                df = self.processor.load_raw_data(path)
+                self.assertEqual(df.to_dict('records'), records)
+                
+                chunks = list(self.processor.iter_raw_data(path, chunksize=1))
+                self.assertEqual([len(chunk) for chunk in chunks], [1, 1])
+    
+    def test_iter_raw_data_ijson(self):
+        """Test JSON arrays are streamed through ijson from a binary file handle."""
+        records = [{'name': f'Phone {i}', 'price': 100 + i} for i in range(5)]
+        handles = []
+        
+        def items(f, prefix, use_float=False):
+            handles.append(f)
+            self.assertEqual(prefix, 'item')
+            return iter(json.loads(f.read()))
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'products.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(records, f, indent=2)
+            
+            with patch('src.data.processors.HAS_IJSON', True), \
+                    patch('src.data.processors.ijson', SimpleNamespace(items=items), create=True):
+                chunks = list(self.processor.iter_raw_data(path, chunksize=2))
+        
+        self.assertEqual(len(handles), 1)
+        self.assertEqual(handles[0].mode, 'rb')
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual(pd.concat(chunks, ignore_index=True).to_dict('records'), records)
+    
+    def test_process_files(self):
+        """Test processing several files in worker processes."""
+        records = self.sample_data.to_dict('records')
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = []
+            for name in ('first', 'second'):
+                path = os.path.join(tmp_dir, f'{name}.json')
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(records, f)
+                paths.append(path)
+            
+            reports = self.processor.process_files(paths, os.path.join(tmp_dir, 'out'), num_proc=2)
+        
+        self.assertEqual([report['input_file'] for report in reports], paths)
+        self.assertEqual([report['processed_records'] for report in reports], [1, 1])
+    
+    def test_validate_empty_data(self):
+        """Test validation of an empty DataFrame."""
+        clean_df, report = self.processor.validate_data(pd.DataFrame())
+        self.assertTrue(clean_df.empty)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,12 +6,13 @@ import unittest
 import tempfile
 import os
 import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, ANY
 from datetime import datetime
 
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from bs4 import BeautifulSoup
 from src.scrapers.ee_scraper.ee_scraper import EEScraper
 
 
@@ -51,7 +52,7 @@ class TestEEScraper(unittest.TestCase):
             result = self.scraper.clean_price_to_number(input_price)
             self.assertEqual(result, expected)
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_listing_pages(self, mock_get):
         """Test getting listing pages."""
         mock_response = MagicMock()
@@ -67,33 +68,76 @@ class TestEEScraper(unittest.TestCase):
         self.assertIsInstance(urls, list)
         self.assertGreater(len(urls), 0)
     
+    @patch('requests.Session.get')
+    def test_get_listing_pages_fills_elided_pages(self, mock_get):
+        """Test pages hidden behind an ellipsis are added once per page number."""
+        base = EEScraper.BASE_URL
+        mock_response = MagicMock()
+        mock_response.content = f'''
+        <html><body>
+            <a href="{base}?page=0" class="sc-65de7bd2-2">1</a>
+            <a href="{base}?page=1" class="sc-65de7bd2-2">2</a>
+            <a href="{base}?page=4" class="sc-65de7bd2-2">5</a>
+        </body></html>
+        '''
+        mock_get.return_value = mock_response
+        
+        urls = self.scraper.get_all_listing_pages()
+        self.assertEqual(urls, [base] + [f"{base}?page={n}" for n in range(1, 5)])
+    
     def test_parse_product_valid(self):
         """Test parsing valid product."""
-        mock_div = MagicMock()
-        mock_name = MagicMock()
-        mock_name.text.strip.return_value = "iPhone 13 Pro"
-        
-        mock_div.select_one.side_effect = lambda selector: {
-            "h3.sc-3ff391e0-4, h3.iwNALa": mock_name,
-            "a[href]": MagicMock(get=lambda x: "/mobile-phone/iphone-13"),
-            "span": MagicMock(text="999₾")
-        }.get(selector)
+        html = '''
+        <div class="sc-3ff391e0-5">
+            <h3 class="sc-3ff391e0-4">iPhone 13 Pro</h3>
+            <a class="sc-3ff391e0-3" href="/mobile-phone/iphone-13">iPhone</a>
+            <span class="sc-3ff391e0-6">1,299₾</span>
+        </div>
+        '''
+        product_div = BeautifulSoup(html, 'html.parser').div
         
-        result = self.scraper.parse_product_from_listing(mock_div)
+        result = self.scraper.parse_product_from_listing(product_div)
         
         self.assertIsInstance(result, dict)
         self.assertEqual(result['name'], "iPhone 13 Pro")
-        self.assertEqual(result['price'], 999)
+        self.assertEqual(result['price'], 1299)
+        self.assertEqual(result['link'], "https://beta.ee.ge/mobile-phone/iphone-13")
+        self.assertEqual(result['category'], "phones")
+    
+    def test_parse_product_fallback_selectors(self):
+        """Test parsing a product div without the styled classes."""
+        html = '''
+        <div class="product-card">
+            <h2 class="title">Samsung Galaxy A15</h2>
+            <a href="/accessory/galaxy-a15-case">Case</a>
+            <span>New</span>
+            <div class="product-cost">499 ₾</div>
+        </div>
+        '''
+        product_div = BeautifulSoup(html, 'html.parser').div
+        
+        result = self.scraper.parse_product_from_listing(product_div)
+        
+        self.assertIsInstance(result, dict)
+        self.assertEqual(result['name'], "Samsung Galaxy A15")
+        self.assertEqual(result['price'], 499)
+        self.assertEqual(result['category'], "accessories")
     
     def test_parse_product_invalid(self):
         """Test parsing invalid product."""
-        mock_div = MagicMock()
-        mock_div.select_one.return_value = MagicMock(text="Unknown")
+        invalid_divs = [
+            '<div><h3 class="sc-3ff391e0-4">Unknown</h3><a href="/mobile-phone/x">x</a><span>99₾</span></div>',
+            '<div><h3>iPhone 13</h3><span>999₾</span></div>',
+            '<div><h3>iPhone 13</h3><a href="/laptops/x">x</a><span>999₾</span></div>',
+            '<div><h3>iPhone 13</h3><a href="/mobile-phone/x">x</a><span>0₾</span></div>',
+        ]
         
-        result = self.scraper.parse_product_from_listing(mock_div)
-        self.assertIsNone(result)
+        for html in invalid_divs:
+            with self.subTest(html=html):
+                product_div = BeautifulSoup(html, 'html.parser').div
+                self.assertIsNone(self.scraper.parse_product_from_listing(product_div))
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_parse_product_details(self, mock_get):
         """Test parsing product details."""
         mock_response = MagicMock()
@@ -113,6 +157,124 @@ class TestEEScraper(unittest.TestCase):
         self.assertIsInstance(result, dict)
         self.assertEqual(result['sku'], "SKU123")
         self.assertIn("12 months warranty", result['warranty'])
+    
+    @patch('requests.Session.get')
+    def test_parse_product_details_cached(self, mock_get):
+        """Test a product page is downloaded once and callers get independent copies."""
+        mock_response = MagicMock()
+        mock_response.content = b'<html><body><span class="sc-235e453a-19 eOnNNp">SKU9</span></body></html>'
+        mock_get.return_value = mock_response
+        
+        first = self.scraper.parse_product_details("https://beta.ee.ge/a")
+        first['sku'] = "changed"
+        second = self.scraper.parse_product_details("https://beta.ee.ge/a")
+        
+        mock_get.assert_called_once()
+        self.assertEqual(second['sku'], "SKU9")
+    
+    @patch('src.scrapers.ee_scraper.ee_scraper.save_products_to_json', side_effect=lambda products, path: path)
+    def test_run_parses_fetched_pages(self, mock_save):
+        """Test run parses the downloaded listing pages."""
+        page = '''
+        <html><body>
+            <div class="sc-3ff391e0-5 duSkO">
+                <h3 class="sc-3ff391e0-4">Samsung Galaxy S24</h3>
+                <a href="/mobile-phone/galaxy-s24">Galaxy</a>
+                <span class="sc-3ff391e0-6">1,299₾</span>
+            </div>
+        </body></html>
+        '''.encode()
+        pages = ["https://beta.ee.ge/a?page=0", "https://beta.ee.ge/a?page=1"]
+        self.scraper.sleep = 0
+        
+        with patch.object(self.scraper, 'get_all_listing_pages', return_value=pages), \
+                patch.object(self.scraper, '_fetch_with_session', return_value=[page, b""]) as mock_fetch:
+            products = self.scraper.run()
+        
+        mock_fetch.assert_called_once_with(ANY, pages)
+        self.assertEqual(len(products), 1)
+        self.assertEqual(products[0]['price'], 1299)
+        self.assertEqual(products[0]['link'], "https://beta.ee.ge/mobile-phone/galaxy-s24")
+    
+    @patch('requests.Session.get')
+    @patch('src.scrapers.ee_scraper.ee_scraper.save_products_to_json', side_effect=lambda products, path: path)
+    def test_run_reuses_first_listing_page(self, mock_save, mock_get):
+        """Test run does not download the page already fetched for pagination again."""
+        mock_response = MagicMock()
+        mock_response.content = b'<html><body><a href="?page=1" class="sc-65de7bd2-2">1</a></body></html>'
+        mock_get.return_value = mock_response
+        self.scraper.sleep = 0
+        
+        with patch.object(self.scraper, '_fetch_with_session', side_effect=lambda session, urls: [b""] * len(urls)) as mock_fetch:
+            self.scraper.run()
+        
+        fetched = mock_fetch.call_args[0][1]
+        self.assertNotIn(EEScraper.BASE_URL, fetched)
+        self.assertEqual(len(fetched), 1)
+        mock_get.assert_called_once()
+    
+    @patch('src.scrapers.ee_scraper.ee_scraper.save_products_to_json', side_effect=lambda products, path: path)
+    def test_run_stops_fetching_at_max_products(self, mock_save):
+        """Test run downloads no further batches once max_products is reached."""
+        page = '''
+        <div class="sc-3ff391e0-5 duSkO">
+            <h3 class="sc-3ff391e0-4">Samsung Galaxy S24</h3>
+            <a href="/mobile-phone/galaxy-s24">Galaxy</a>
+            <span class="sc-3ff391e0-6">1,299₾</span>
+        </div>
+        '''.encode()
+        pages = [f"https://beta.ee.ge/a?page={n}" for n in range(6)]
+        scraper = EEScraper(max_products=1, sleep=0, max_concurrency=2)
+        
+        with patch.object(scraper, 'get_all_listing_pages', return_value=pages), \
+                patch.object(scraper, '_fetch_with_session', side_effect=lambda session, urls: [page] * len(urls)) as mock_fetch:
+            products = scraper.run()
+        
+        self.assertEqual(len(products), 1)
+        mock_fetch.assert_called_once_with(ANY, pages[:2])
+    
+    @patch('src.scrapers.ee_scraper.ee_scraper.save_products_to_json', side_effect=lambda products, path: path)
+    def test_run_shares_one_session_across_batches(self, mock_save):
+        """Test every listing batch is downloaded over the same session, closed afterwards."""
+        page = '''
+        <div class="sc-3ff391e0-5 duSkO">
+            <h3 class="sc-3ff391e0-4">Samsung Galaxy S24</h3>
+            <a href="/mobile-phone/galaxy-s24">Galaxy</a>
+            <span class="sc-3ff391e0-6">1,299₾</span>
+        </div>
+        '''.encode()
+        pages = [f"https://beta.ee.ge/a?page={n}" for n in range(5)]
+        scraper = EEScraper(max_products=100, sleep=0, max_concurrency=2)
+        sessions = []
+        
+        async def fetch(session, urls):
+            sessions.append(session)
+            return [page] * len(urls)
+        
+        with patch.object(scraper, 'get_all_listing_pages', return_value=pages), \
+                patch.object(scraper, '_fetch_with_session', side_effect=fetch):
+            scraper.run()
+        
+        self.assertEqual(len(sessions), 3)
+        self.assertTrue(all(session is sessions[0] for session in sessions))
+        self.assertTrue(sessions[0].closed)
+    
+    def test_find_product_divs(self):
+        """Test container lookup prefers the most specific class and falls back to content."""
+        ranked = BeautifulSoup('''
+            <div class="card"><div class="sc-3ff391e0-5">A</div></div>
+            <article>B</article>
+            <div class="sc-3ff391e0-5 x">C</div>
+        ''', "html.parser")
+        self.assertEqual([div.text for div in self.scraper.find_product_divs(ranked)], ["A", "C"])
+        
+        unranked = BeautifulSoup('''
+            <section><div id="outer"><div id="inner">
+                <h3>Nokia 3310</h3><span>99 ₾</span><a href="/mobile-phone/nokia">Nokia</a>
+            </div></div><div id="name-only"><h3>Cable</h3></div></section>
+        ''', "html.parser")
+        found = [div["id"] for div in self.scraper.find_product_divs(unranked)]
+        self.assertEqual(found, ["outer", "inner"])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,51 @@
+"""
+Unit tests for the Zoomer scraper pipelines.
+"""
+
+import unittest
+import os
+from decimal import Decimal
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.scrapers.zoomer_scraper.zoomer_scraper.pipelines import DatabasePipeline
+
+
+class TestDatabasePipelinePrice(unittest.TestCase):
+
+    def test_parse_price_european_format(self):
+        """Test '.' thousands separators with a ',' decimal point."""
+        self.assertEqual(DatabasePipeline._parse_price("1.299,99"), Decimal("1299.99"))
+        self.assertEqual(DatabasePipeline._parse_price("1.299.000,50 ₾"), Decimal("1299000.50"))
+
+    def test_parse_price_english_format(self):
+        """Test ',' thousands separators with a '.' decimal point."""
+        self.assertEqual(DatabasePipeline._parse_price("1,299.99"), Decimal("1299.99"))
+        self.assertEqual(DatabasePipeline._parse_price("₾ 2,499.00"), Decimal("2499.00"))
+
+    def test_parse_price_repeated_separator(self):
+        """Test the last separator is the decimal point when two digits follow it."""
+        self.assertEqual(DatabasePipeline._parse_price("1.299.00"), Decimal("1299.00"))
+
+    def test_parse_price_thousands_only(self):
+        """Test separators not followed by exactly two digits group thousands."""
+        self.assertEqual(DatabasePipeline._parse_price("1,299"), Decimal("1299"))
+        self.assertEqual(DatabasePipeline._parse_price("1.299"), Decimal("1299"))
+        self.assertEqual(DatabasePipeline._parse_price(999), Decimal("999"))
+
+    def test_parse_price_numbers_kept(self):
+        """Test numeric prices are converted without separator handling."""
+        self.assertEqual(DatabasePipeline._parse_price(999.5), Decimal("999.5"))
+        self.assertEqual(DatabasePipeline._parse_price(Decimal("12.345")), Decimal("12.345"))
+
+    def test_parse_price_missing_or_invalid(self):
+        """Test empty prices give None and prices without digits raise ValueError."""
+        self.assertIsNone(DatabasePipeline._parse_price(None))
+        self.assertIsNone(DatabasePipeline._parse_price(""))
+        with self.assertRaises(ValueError):
+            DatabasePipeline._parse_price("call for price")
+
+
+if __name__ == '__main__':
+    unittest.main()